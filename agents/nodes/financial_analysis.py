@@ -24,7 +24,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from agents.state import EquityResearchState
 from utils.logger import logger
-from config.settings import RISK_FREE_RATE, EXPECTED_MARKET_RETURN
+from config.settings import get_settings
 
 # Import analysis tools
 from tools.ratio_calculator import RatioCalculator
@@ -250,6 +250,7 @@ def analyze_node(state: EquityResearchState) -> Dict[str, Any]:
     
     # ==================== 3. CAPM COST OF EQUITY ====================
     logger.info("\n💰 Step 3/5: Calculating Cost of Equity (CAPM)...")
+    settings = get_settings()
     try:
         if updates.get('beta') is None:
             raise ValueError("Beta not calculated - cannot compute CAPM")
@@ -257,15 +258,15 @@ def analyze_node(state: EquityResearchState) -> Dict[str, Any]:
         # Calculate cost of equity
         cost_of_equity = calculate_capm_cost_of_equity(
             beta=updates['beta'],
-            risk_free_rate=RISK_FREE_RATE,
-            market_return=EXPECTED_MARKET_RETURN
+            risk_free_rate=settings.risk_free_rate,
+            market_return=settings.expected_market_return
         )
         
         updates['cost_of_equity'] = cost_of_equity['cost_of_equity']
         
         logger.success(f"✅ Cost of Equity (CAPM): {cost_of_equity['cost_of_equity']:.2%}")
-        logger.info(f"   Risk-Free Rate: {RISK_FREE_RATE:.2%}")
-        logger.info(f"   Market Return: {EXPECTED_MARKET_RETURN:.2%}")
+        logger.info(f"   Risk-Free Rate: {settings.risk_free_rate:.2%}")
+        logger.info(f"   Market Return: {settings.expected_market_return:.2%}")
         logger.info(f"   Beta: {updates['beta']:.3f}")
         logger.info(f"   Equity Risk Premium: {cost_of_equity.get('equity_risk_premium', 0):.2%}")
         
@@ -285,7 +286,7 @@ def analyze_node(state: EquityResearchState) -> Dict[str, Any]:
         
         mrp_result = calculate_market_risk_premium(
             market_returns=market_returns,
-            risk_free_rate=RISK_FREE_RATE
+            risk_free_rate=settings.risk_free_rate
         )
         
         # Extract the premium value (check both possible keys)
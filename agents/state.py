@@ -8,6 +8,7 @@ update this shared state.
 LangGraph Best Practice: Define state schema FIRST before creating nodes.
 """
 
+import sys
 from typing import TypedDict, Optional, Dict, List, Any
 from datetime import datetime
 import pandas as pd
@@ -322,18 +323,29 @@ def create_initial_state(ticker: str, company_name: Optional[str] = None) -> Equ
     """
     Create initial state for workflow.
     
+    The ticker is normalized here exactly once (stripped, uppercased and
+    interned), so downstream nodes and validators can rely on
+    ``state['ticker']`` being a non-empty canonical symbol.
+    
     Args:
-        ticker: Company ticker symbol (e.g., "RELIANCE")
+        ticker: Company ticker symbol (e.g., "RELIANCE" or " reliance ")
         company_name: Full company name (optional, will be fetched if not provided)
     
     Returns:
         EquityResearchState with initial values
     
+    Raises:
+        ValueError: If ticker is empty or whitespace-only
+    
     Example:
         >>> initial_state = create_initial_state("RELIANCE", "Reliance Industries")
         >>> app = create_research_graph()
         >>> result = app.invoke(initial_state)
     """
+    ticker = sys.intern(ticker.strip().upper())
+    if not ticker:
+        raise ValueError("Ticker cannot be empty")
+    
     return EquityResearchState(
         ticker=ticker,
         company_name=company_name or ticker,
@@ -397,11 +409,13 @@ def validate_input_state(state: EquityResearchState) -> tuple[bool, List[str]]:
     """
     errors = []
     
-    if not state.get('ticker'):
+    # create_initial_state() rejects empty tickers, but hand-built state
+    # dicts can still carry ticker=''
+    if state.get('ticker') is None:
         errors.append("Missing required field: 'ticker'")
     elif not isinstance(state['ticker'], str):
         errors.append("Field 'ticker' must be a string")
-    elif len(state['ticker']) == 0:
+    elif not state['ticker'].strip():
         errors.append("Field 'ticker' cannot be empty")
     
     if not state.get('company_name'):
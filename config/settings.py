@@ -2,177 +2,462 @@
 Configuration settings for Equity Research Report Generator.
 
 This module loads environment variables and provides configuration
-for the entire application.
+for the entire application. Environment-driven values live on a frozen
+Settings object returned by get_settings(); the legacy uppercase names
+(e.g. RISK_FREE_RATE) remain importable and resolve against it.
+
+Importing this module has no side effects: .env is loaded and paths are
+resolved when get_settings() first runs, and the data/outputs directories
+are created by init_config().
 """
 
+import hashlib
 import os
+import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
-# Project root directory
-PROJECT_ROOT = Path(__file__).parent.parent
-
-# ==================== LLM Configuration ====================
+from types import MappingProxyType
+from typing import Annotated, Literal, Optional
+from urllib.parse import SplitResult, urlsplit
+from pydantic import Field, ValidationError
+from pydantic.dataclasses import dataclass
 
-# LLM Provider (groq, ollama, or gemini)
-LLM_PROVIDER = os.getenv("LLM_PROVIDER", "groq")
 
-# Groq Configuration
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-GROQ_MODEL = os.getenv("GROQ_MODEL", "llama-3.1-70b-versatile")
-GROQ_TEMPERATURE = float(os.getenv("GROQ_TEMPERATURE", "0.3"))
+# ==================== Settings ====================
 
-# Ollama Configuration (Alternative)
-OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
-OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3")
+# Accepted LLM providers
+LLMProvider = Literal["groq", "ollama", "gemini"]
 
-# Gemini Configuration (Alternative)
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-pro")
+# Rates are fractions, e.g. 0.0725 for 7.25%
+Rate = Annotated[float, Field(gt=0, lt=1)]
 
-# ==================== Indian Market Configuration ====================
 
-# Market Benchmark
-DEFAULT_MARKET_INDEX = os.getenv("DEFAULT_MARKET_INDEX", "^NSEI")  # NIFTY 50
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    Immutable snapshot of all environment-driven configuration.
+    
+    Built once per process by get_settings(). Pydantic parses, coerces and
+    range-checks every field in a single pass at construction, so a bad
+    value raises ValidationError immediately instead of surfacing later.
+    """
+    
+    # LLM Configuration
+    llm_provider: LLMProvider
+    groq_api_key: Optional[str]
+    groq_model: str
+    groq_temperature: float
+    ollama_base_url: str
+    ollama_model: str
+    gemini_api_key: Optional[str]
+    gemini_model: str
+    
+    # Indian Market Configuration
+    default_market_index: str          # NIFTY 50
+    risk_free_rate: Rate               # 7.25% G-Sec
+    expected_market_return: Rate       # 13%
+    nse_suffix: str                    # National Stock Exchange
+    bse_suffix: str                    # Bombay Stock Exchange
+    
+    # Data Configuration
+    years_of_data: int
+    months_of_news: int
+    
+    # System Configuration
+    max_retries: int
+    retry_delay: int
+    log_level: str
+    
+    # Directory Paths (resolved once when settings are built)
+    project_root: Path
+    data_dir: Path
+    outputs_dir: Path
+    templates_dir: Path
+    report_template: Path
+    
+    @property
+    def market_risk_premium(self) -> float:
+        """Market risk premium (Rm - Rf)."""
+        return self.expected_market_return - self.risk_free_rate
+
+
+# Environment variable → default for every env-backed Settings field
+# (the field name is the lowercased variable name)
+_ENV_FIELDS = (
+    # LLM Configuration
+    ("LLM_PROVIDER", "groq"),
+    ("GROQ_API_KEY", None),
+    ("GROQ_MODEL", "llama-3.1-70b-versatile"),
+    ("GROQ_TEMPERATURE", "0.3"),
+    ("OLLAMA_BASE_URL", "http://localhost:11434"),
+    ("OLLAMA_MODEL", "llama3"),
+    ("GEMINI_API_KEY", None),
+    ("GEMINI_MODEL", "gemini-pro"),
+    # Indian Market Configuration
+    ("DEFAULT_MARKET_INDEX", "^NSEI"),
+    ("RISK_FREE_RATE", "0.0725"),
+    ("EXPECTED_MARKET_RETURN", "0.13"),
+    ("NSE_SUFFIX", ".NS"),
+    ("BSE_SUFFIX", ".BO"),
+    # Data Configuration
+    ("YEARS_OF_DATA", "5"),
+    ("MONTHS_OF_NEWS", "12"),
+    # System Configuration
+    ("MAX_RETRIES", "3"),
+    ("RETRY_DELAY", "2"),
+    ("LOG_LEVEL", "INFO"),
+)
+
+# .env file watched by the settings cache fingerprint
+_DOTENV_PATH = Path(__file__).parent.parent / ".env"
+
+# (fingerprint, settings) for the last build; rebuilt under _settings_lock
+_cached_settings: Optional[tuple[tuple, Settings]] = None
+_settings_lock = threading.Lock()
+
+
+def _env_fingerprint() -> tuple:
+    """Cheap fingerprint of the inputs to Settings: .env mtime + os.environ."""
+    try:
+        dotenv_mtime = os.stat(_DOTENV_PATH).st_mtime_ns
+    except OSError:
+        dotenv_mtime = None
+    return dotenv_mtime, hash(frozenset(os.environ.items()))
+
+
+def get_settings() -> Settings:
+    """
+    Get the process-wide configuration.
+    
+    The Settings object is cached and reused for as long as the .env file
+    and os.environ are unchanged, so tests that patch environment variables
+    still see fresh values. Caches derived from it (validation, ticker
+    suffixes) are keyed on the fingerprint or on the values they use.
+    
+    Returns:
+        Settings: Frozen configuration object
+    
+    Raises:
+        ValidationError: If any environment value is invalid
+    """
+    global _cached_settings
+    
+    cached = _cached_settings
+    if cached is not None and cached[0] == _env_fingerprint():
+        return cached[1]
+    
+    with _settings_lock:
+        cached = _cached_settings
+        if cached is not None and cached[0] == _env_fingerprint():
+            return cached[1]
+        
+        settings = _build_settings()
+        # Fingerprint after load_dotenv() so the next call matches
+        _cached_settings = (_env_fingerprint(), settings)
+        return settings
+
+
+def _build_settings() -> Settings:
+    """Load .env and build a Settings object from the current environment."""
+    from dotenv import load_dotenv
+    load_dotenv()
+    env = os.environ.copy()
+    
+    project_root = Path(__file__).parent.parent
+    templates_dir = project_root / "templates"
+    
+    # Pydantic coerces the raw strings to each field's declared type
+    values = {name.lower(): env.get(name, default) for name, default in _ENV_FIELDS}
+    
+    return Settings(
+        **values,
+        project_root=project_root,
+        data_dir=project_root / "data",
+        outputs_dir=project_root / "outputs",
+        templates_dir=templates_dir,
+        report_template=templates_dir / "Equity Research Report-Template.docx",
+    )
+
+
+@lru_cache(maxsize=1)
+def init_config() -> None:
+    """
+    Perform one-time configuration side effects.
+    
+    Creates the data/outputs directories. Importing this module does no
+    I/O; this runs on first use instead (the UI and run_ui.py call it, as do
+    validate_config(), get_llm() and print_config(), and it is triggered
+    when DATA_DIR / OUTPUTS_DIR are accessed) and is a no-op on subsequent
+    calls.
+    """
+    s = get_settings()
+    s.data_dir.mkdir(exist_ok=True)
+    s.outputs_dir.mkdir(exist_ok=True)
+
+
+# Legacy module-level names (e.g. `from config.settings import RISK_FREE_RATE`)
+# are resolved lazily from get_settings() via module __getattr__ below.
+_SETTINGS_ALIASES = {
+    "LLM_PROVIDER": "llm_provider",
+    "GROQ_API_KEY": "groq_api_key",
+    "GROQ_MODEL": "groq_model",
+    "GROQ_TEMPERATURE": "groq_temperature",
+    "OLLAMA_BASE_URL": "ollama_base_url",
+    "OLLAMA_MODEL": "ollama_model",
+    "GEMINI_API_KEY": "gemini_api_key",
+    "GEMINI_MODEL": "gemini_model",
+    "DEFAULT_MARKET_INDEX": "default_market_index",
+    "RISK_FREE_RATE": "risk_free_rate",
+    "EXPECTED_MARKET_RETURN": "expected_market_return",
+    "MARKET_RISK_PREMIUM": "market_risk_premium",
+    "NSE_SUFFIX": "nse_suffix",
+    "BSE_SUFFIX": "bse_suffix",
+    "YEARS_OF_DATA": "years_of_data",
+    "MONTHS_OF_NEWS": "months_of_news",
+    "MAX_RETRIES": "max_retries",
+    "RETRY_DELAY": "retry_delay",
+    "LOG_LEVEL": "log_level",
+    "PROJECT_ROOT": "project_root",
+    "TEMPLATES_DIR": "templates_dir",
+    "REPORT_TEMPLATE": "report_template",
+}
 
-# Financial Parameters (Indian Markets)
-RISK_FREE_RATE = float(os.getenv("RISK_FREE_RATE", "0.0725"))  # 7.25% G-Sec
-EXPECTED_MARKET_RETURN = float(os.getenv("EXPECTED_MARKET_RETURN", "0.13"))  # 13%
+# Directories that must exist when handed out
+_DIRECTORY_ALIASES = {
+    "DATA_DIR": "data_dir",
+    "OUTPUTS_DIR": "outputs_dir",
+}
 
-# Market Risk Premium (calculated)
-MARKET_RISK_PREMIUM = EXPECTED_MARKET_RETURN - RISK_FREE_RATE
 
-# Exchange Suffixes
-NSE_SUFFIX = os.getenv("NSE_SUFFIX", ".NS")  # National Stock Exchange
-BSE_SUFFIX = os.getenv("BSE_SUFFIX", ".BO")  # Bombay Stock Exchange
+def __getattr__(name: str):
+    """Resolve legacy constant names against the cached Settings object."""
+    if name in _SETTINGS_ALIASES:
+        return getattr(get_settings(), _SETTINGS_ALIASES[name])
+    if name in _DIRECTORY_ALIASES:
+        init_config()
+        return getattr(get_settings(), _DIRECTORY_ALIASES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ==================== Data Configuration ====================
 
-# Time Periods
-YEARS_OF_DATA = int(os.getenv("YEARS_OF_DATA", "5"))
-MONTHS_OF_NEWS = int(os.getenv("MONTHS_OF_NEWS", "12"))
-
-# Data Sources
-NEWS_SOURCES = [
+# Data Sources (raw URLs, and pre-split once for .netloc / .path access)
+NEWS_SOURCE_URLS = (
     "https://www.moneycontrol.com",
     "https://economictimes.indiatimes.com",
     "https://www.nseindia.com"
-]
-
-# ==================== System Configuration ====================
-
-# Retry Logic
-MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
-RETRY_DELAY = int(os.getenv("RETRY_DELAY", "2"))
-
-# Logging
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-
-# ==================== Directory Paths ====================
-
-# Data directories
-DATA_DIR = PROJECT_ROOT / "data"
-OUTPUTS_DIR = PROJECT_ROOT / "outputs"
-TEMPLATES_DIR = PROJECT_ROOT / "templates"
-
-# Create directories if they don't exist
-DATA_DIR.mkdir(exist_ok=True)
-OUTPUTS_DIR.mkdir(exist_ok=True)
+)
+NEWS_SOURCES: tuple[SplitResult, ...] = tuple(urlsplit(url) for url in NEWS_SOURCE_URLS)
 
 # ==================== Financial Ratios Configuration ====================
 
-# Minimum required ratios (as per assignment)
-REQUIRED_RATIOS = {
-    "liquidity": ["current_ratio", "cash_ratio"],
-    "efficiency": ["asset_turnover", "inventory_turnover", "receivables_turnover"],
-    "solvency": ["debt_to_equity", "interest_coverage"],
-    "profitability": ["net_profit_margin", "roe", "roa", "gross_margin"]
-}
+# Minimum required ratios (as per assignment), read-only with O(1) membership
+REQUIRED_RATIOS = MappingProxyType({
+    "liquidity": frozenset({"current_ratio", "cash_ratio"}),
+    "efficiency": frozenset({"asset_turnover", "inventory_turnover", "receivables_turnover"}),
+    "solvency": frozenset({"debt_to_equity", "interest_coverage"}),
+    "profitability": frozenset({"net_profit_margin", "roe", "roa", "gross_margin"})
+})
 
-# ==================== Document Generation Settings ====================
+# All required ratio names across categories
+REQUIRED_RATIOS_FLAT = frozenset().union(*REQUIRED_RATIOS.values())
 
-# Report Template
-REPORT_TEMPLATE = TEMPLATES_DIR / "Equity Research Report-Template.docx"
+# ==================== Document Generation Settings ====================
 
-# File Naming
+# File Naming (str.format / format_map templates)
 REPORT_FILENAME_TEMPLATE = "{company_name}_Equity_Research_{date}.docx"
 EXCEL_FILENAME_TEMPLATE = "{company_name}_Financial_Analysis_{date}.xlsx"
 
 # ==================== Validation ====================
 
-def validate_config() -> tuple[bool, list[str]]:
+def _compute_validation() -> tuple[bool, tuple[str, ...]]:
     """
-    Validate that all required configuration is set.
+    Check the current configuration.
+    
+    Field types and ranges are enforced by Settings itself; this adds the
+    cross-field checks (API key for the chosen provider, template file).
     
     Returns:
-        tuple: (is_valid, list of errors)
+        tuple: (is_valid, tuple of errors)
     """
-    errors = []
+    try:
+        s = get_settings()
+    except ValidationError as e:
+        return False, tuple(
+            f"Invalid {str(err['loc'][0]).upper()}: {err['input']}. {err['msg']}"
+            for err in e.errors()
+        )
+    init_config()
+    
+    template_exists = _report_template_exists(s.report_template)
     
-    # Check LLM Provider is set correctly
-    if LLM_PROVIDER not in ["groq", "ollama", "gemini"]:
-        errors.append(f"Invalid LLM_PROVIDER: {LLM_PROVIDER}. Must be 'groq', 'ollama', or 'gemini'")
+    # Fast path: the provider has what it needs and the template is present
+    has_llm_credentials = (
+        (s.llm_provider == "groq" and s.groq_api_key)
+        or (s.llm_provider == "gemini" and s.gemini_api_key)
+        or s.llm_provider == "ollama"
+    )
+    if has_llm_credentials and template_exists:
+        return True, ()
+    
+    errors = []
     
     # Check Groq API key if using Groq
-    if LLM_PROVIDER == "groq" and not GROQ_API_KEY:
+    if s.llm_provider == "groq" and not s.groq_api_key:
         errors.append("GROQ_API_KEY not set. Get one at: https://console.groq.com/")
     
     # Check Gemini API key if using Gemini
-    if LLM_PROVIDER == "gemini" and not GEMINI_API_KEY:
+    if s.llm_provider == "gemini" and not s.gemini_api_key:
         errors.append("GEMINI_API_KEY not set. Get one at: https://makersuite.google.com/")
     
-    # Validate financial parameters
-    if not (0 < RISK_FREE_RATE < 1):
-        errors.append(f"Invalid RISK_FREE_RATE: {RISK_FREE_RATE}. Should be between 0 and 1 (e.g., 0.0725 for 7.25%)")
-    
-    if not (0 < EXPECTED_MARKET_RETURN < 1):
-        errors.append(f"Invalid EXPECTED_MARKET_RETURN: {EXPECTED_MARKET_RETURN}. Should be between 0 and 1 (e.g., 0.13 for 13%)")
-    
     # Check report template exists
-    if not REPORT_TEMPLATE.exists():
-        errors.append(f"Report template not found: {REPORT_TEMPLATE}")
+    if not template_exists:
+        errors.append(f"Report template not found: {s.report_template}")
     
-    return len(errors) == 0, errors
+    return len(errors) == 0, tuple(errors)
 
 
-def get_llm():
+# Set once the report template has been found; later checks skip the stat
+_TEMPLATE_EXISTS = False
+
+
+def _report_template_exists(path: Path) -> bool:
+    """Check the report template with os.path.isfile, remembering a hit."""
+    global _TEMPLATE_EXISTS
+    if not _TEMPLATE_EXISTS:
+        _TEMPLATE_EXISTS = os.path.isfile(path)
+    return _TEMPLATE_EXISTS
+
+
+@lru_cache(maxsize=1)
+def _validation_for(fingerprint: tuple) -> tuple[bool, tuple[str, ...]]:
+    """Validation result memoized per environment fingerprint."""
+    return _compute_validation()
+
+
+def validate_config() -> tuple[bool, tuple[str, ...]]:
     """
-    Get the configured LLM instance.
+    Validate that all required configuration is set.
+    
+    The result is memoized on the same .env/os.environ fingerprint as
+    get_settings(), so it is recomputed whenever the environment changes,
+    including to values that fail to load.
     
     Returns:
-        LLM instance configured based on LLM_PROVIDER setting
+        tuple: (is_valid, tuple of errors)
+    """
+    return _validation_for(_env_fingerprint())
+
+
+def invalidate_config_cache() -> None:
+    """Clear the memoized validate_config() result (for tests)."""
+    _validation_for.cache_clear()
+
+
+@lru_cache(maxsize=4)
+def _build_llm(provider: str, model: str, temperature: Optional[float], credential_digest: str):
+    """
+    Construct an LLM client; memoized per (provider, model, temperature, credential).
+    
+    The digest only keys the cache (so a rotated API key or endpoint gets a
+    new client); the actual credential is read from settings here.
     """
-    if LLM_PROVIDER == "groq":
+    s = get_settings()
+    
+    if provider == "groq":
         from langchain_groq import ChatGroq
         return ChatGroq(
-            groq_api_key=GROQ_API_KEY,
-            model_name=GROQ_MODEL,
-            temperature=GROQ_TEMPERATURE
+            groq_api_key=s.groq_api_key,
+            model_name=model,
+            temperature=temperature
         )
-    elif LLM_PROVIDER == "ollama":
+    elif provider == "ollama":
         from langchain_ollama import OllamaLLM
         return OllamaLLM(
-            model=OLLAMA_MODEL,
-            base_url=OLLAMA_BASE_URL
+            model=model,
+            base_url=s.ollama_base_url
         )
-    elif LLM_PROVIDER == "gemini":
+    elif provider == "gemini":
         from langchain_google_genai import ChatGoogleGenerativeAI
         return ChatGoogleGenerativeAI(
-            google_api_key=GEMINI_API_KEY,
-            model=GEMINI_MODEL
+            google_api_key=s.gemini_api_key,
+            model=model
         )
     else:
-        raise ValueError(f"Unsupported LLM provider: {LLM_PROVIDER}")
+        raise ValueError(f"Unsupported LLM provider: {provider}")
+
+
+def get_llm():
+    """
+    Get the configured LLM instance.
+    
+    The client is built once per (provider, model, temperature, API key)
+    and reused on subsequent calls; provider SDKs are only imported when a
+    client is first built.
+    
+    Returns:
+        LLM instance configured based on LLM_PROVIDER setting
+    """
+    init_config()
+    s = get_settings()
+    
+    if s.llm_provider == "groq":
+        model, temperature, credential = s.groq_model, s.groq_temperature, s.groq_api_key
+    elif s.llm_provider == "ollama":
+        model, temperature, credential = s.ollama_model, None, s.ollama_base_url
+    else:
+        model, temperature, credential = s.gemini_model, None, s.gemini_api_key
+    
+    # Never key (or log) the raw API key
+    credential_digest = hashlib.blake2s((credential or "").encode()).hexdigest()
+    return _build_llm(s.llm_provider, model, temperature, credential_digest)
+
+
+def reset_llm_cache() -> None:
+    """Drop all memoized LLM clients (for tests)."""
+    _build_llm.cache_clear()
+
+
+@lru_cache(maxsize=4)
+def _suffix_tables(nse_suffix: str, bse_suffix: str) -> tuple[tuple[str, ...], dict[str, str]]:
+    """
+    Build the known-suffix tuple and exchange → suffix map.
+    
+    The map is preloaded with upper- and lower-case exchange names so the
+    common spellings resolve without a str.upper() call.
+    """
+    suffix_by_exchange = {
+        **{name: nse_suffix for name in ("NSE", "nse")},
+        **{name: bse_suffix for name in ("BSE", "bse")},
+    }
+    return (nse_suffix, bse_suffix), suffix_by_exchange
+
+
+@lru_cache(maxsize=4096)
+def _ticker_with_suffix(ticker: str, exchange: str, nse_suffix: str, bse_suffix: str) -> str:
+    """Suffix a ticker; memoized per (ticker, exchange) and suffix settings."""
+    known_suffixes, suffix_by_exchange = _suffix_tables(nse_suffix, bse_suffix)
+    
+    # If ticker already has suffix, return as is
+    if ticker.endswith(known_suffixes):
+        return ticker
+    
+    # Add appropriate suffix (default to NSE)
+    suffix = (
+        suffix_by_exchange.get(exchange)
+        or suffix_by_exchange.get(exchange.upper(), known_suffixes[0])
+    )
+    return f"{ticker}{suffix}"
 
 
 def get_ticker_with_suffix(ticker: str, exchange: str = "NSE") -> str:
     """
     Add appropriate suffix to ticker based on exchange.
     
+    The suffixes are read from get_settings() on every call, so a changed
+    NSE_SUFFIX / BSE_SUFFIX is picked up immediately; the suffixing itself
+    is memoized per (ticker, exchange, suffixes).
+    
     Args:
         ticker: Base ticker symbol (e.g., "RELIANCE")
         exchange: Exchange name ("NSE" or "BSE")
@@ -180,68 +465,97 @@ def get_ticker_with_suffix(ticker: str, exchange: str = "NSE") -> str:
     Returns:
         Ticker with suffix (e.g., "RELIANCE.NS")
     """
-    # If ticker already has suffix, return as is
-    if ticker.endswith(NSE_SUFFIX) or ticker.endswith(BSE_SUFFIX):
-        return ticker
-    
-    # Add appropriate suffix
-    if exchange.upper() == "NSE":
-        return f"{ticker}{NSE_SUFFIX}"
-    elif exchange.upper() == "BSE":
-        return f"{ticker}{BSE_SUFFIX}"
-    else:
-        # Default to NSE
-        return f"{ticker}{NSE_SUFFIX}"
+    s = get_settings()
+    return _ticker_with_suffix(ticker, exchange, s.nse_suffix, s.bse_suffix)
 
 
 # ==================== Display Configuration ====================
 
+_CONFIG_HEADER = """\
+============================================================
+EQUITY RESEARCH GENERATOR - CONFIGURATION
+============================================================
+"""
+
+_PROVIDER_TEMPLATES = {
+    "groq": """\
+   Model: {groq_model}
+   API Key: {api_key_status}
+""",
+    "ollama": """\
+   Model: {ollama_model}
+   Base URL: {ollama_base_url}
+""",
+    "gemini": """\
+   Model: {gemini_model}
+   API Key: {api_key_status}
+""",
+}
+
+_CONFIG_TEMPLATE = """\
+
+🤖 LLM Configuration:
+   Provider: {llm_provider}
+{provider_block}
+🇮🇳 Indian Market Configuration:
+   Benchmark Index: {default_market_index}
+   Risk-Free Rate: {risk_free_rate:.2%}
+   Expected Market Return: {expected_market_return:.2%}
+   Market Risk Premium: {market_risk_premium:.2%}
+   NSE Suffix: {nse_suffix}
+   BSE Suffix: {bse_suffix}
+
+📊 Data Configuration:
+   Years of Data: {years_of_data}
+   Months of News: {months_of_news}
+   Max Retries: {max_retries}
+
+📁 Directories:
+   Project Root: {project_root}
+   Data: {data_dir}
+   Outputs: {outputs_dir}
+   Templates: {templates_dir}
+
+✅ Configuration Status:
+{status_block}
+============================================================
+"""
+
+
 def print_config():
     """Print current configuration (for debugging)."""
-    print("=" * 60)
-    print("EQUITY RESEARCH GENERATOR - CONFIGURATION")
-    print("=" * 60)
-    print(f"\n🤖 LLM Configuration:")
-    print(f"   Provider: {LLM_PROVIDER}")
-    if LLM_PROVIDER == "groq":
-        print(f"   Model: {GROQ_MODEL}")
-        print(f"   API Key: {'✅ Set' if GROQ_API_KEY else '❌ Not Set'}")
-    elif LLM_PROVIDER == "ollama":
-        print(f"   Model: {OLLAMA_MODEL}")
-        print(f"   Base URL: {OLLAMA_BASE_URL}")
-    elif LLM_PROVIDER == "gemini":
-        print(f"   Model: {GEMINI_MODEL}")
-        print(f"   API Key: {'✅ Set' if GEMINI_API_KEY else '❌ Not Set'}")
-    
-    print(f"\n🇮🇳 Indian Market Configuration:")
-    print(f"   Benchmark Index: {DEFAULT_MARKET_INDEX}")
-    print(f"   Risk-Free Rate: {RISK_FREE_RATE:.2%}")
-    print(f"   Expected Market Return: {EXPECTED_MARKET_RETURN:.2%}")
-    print(f"   Market Risk Premium: {MARKET_RISK_PREMIUM:.2%}")
-    print(f"   NSE Suffix: {NSE_SUFFIX}")
-    print(f"   BSE Suffix: {BSE_SUFFIX}")
-    
-    print(f"\n📊 Data Configuration:")
-    print(f"   Years of Data: {YEARS_OF_DATA}")
-    print(f"   Months of News: {MONTHS_OF_NEWS}")
-    print(f"   Max Retries: {MAX_RETRIES}")
-    
-    print(f"\n📁 Directories:")
-    print(f"   Project Root: {PROJECT_ROOT}")
-    print(f"   Data: {DATA_DIR}")
-    print(f"   Outputs: {OUTPUTS_DIR}")
-    print(f"   Templates: {TEMPLATES_DIR}")
-    
-    # Validate configuration
     is_valid, errors = validate_config()
-    print(f"\n✅ Configuration Status:")
+    
+    try:
+        s = get_settings()
+    except ValidationError:
+        error_lines = "\n".join(f"   - {error}" for error in errors)
+        sys.stdout.write(
+            f"{_CONFIG_HEADER}\n❌ Configuration errors:\n{error_lines}\n{'=' * 60}\n"
+        )
+        sys.stdout.flush()
+        return
+    init_config()
+    
     if is_valid:
-        print("   ✅ All configuration valid!")
+        status_block = "   ✅ All configuration valid!"
     else:
-        print("   ❌ Configuration errors:")
-        for error in errors:
-            print(f"      - {error}")
-    print("=" * 60)
+        status_block = "   ❌ Configuration errors:\n" + "\n".join(
+            f"      - {error}" for error in errors
+        )
+    
+    api_key = s.groq_api_key if s.llm_provider == "groq" else s.gemini_api_key
+    ctx = {
+        field: getattr(s, field)
+        for field in (*s.__dataclass_fields__, "market_risk_premium")
+    }
+    ctx["api_key_status"] = "✅ Set" if api_key else "❌ Not Set"
+    ctx["provider_block"] = _PROVIDER_TEMPLATES[s.llm_provider].format_map(ctx)
+    ctx["status_block"] = status_block
+    
+    # Emit everything with a single write
+    sys.stdout.write(_CONFIG_HEADER + _CONFIG_TEMPLATE.format_map(ctx))
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -7,10 +7,20 @@ This package contains modules to generate final deliverables:
 
 Both generators take the complete EquityResearchState and produce
 professional documents following the assignment template.
-"""
 
-from .word_generator import generate_word_report
-from .excel_generator import generate_excel_workbook
+The generator modules (and python-docx / openpyxl with them) are imported
+lazily on first attribute access, so importing the package is cheap.
+"""
 
 __all__ = ['generate_word_report', 'generate_excel_workbook']
 
+
+def __getattr__(name):
+    if name == 'generate_word_report':
+        from .word_generator import generate_word_report
+        return generate_word_report
+    if name == 'generate_excel_workbook':
+        from .excel_generator import generate_excel_workbook
+        return generate_excel_workbook
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
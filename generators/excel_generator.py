@@ -3,28 +3,130 @@ Excel Workbook Generator for Equity Research Reports.
 
 This module generates comprehensive Excel workbooks (.xlsx) with
 multiple sheets containing all financial data, calculations, and analysis.
+
+Each sheet is first described as a plain, picklable payload (rows of
+values plus a few style tags) by a ``_build_*_payload`` function. Payloads
+are built serially for typical companies, or in a process pool when the
+state carries a lot of tabular data, and are then streamed into an openpyxl
+write-only workbook on the main process.
 """
 
+import io
+import os
+import pickle
 import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
+import numpy as np
 import pandas as pd
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Running this file directly needs the project root on the path; when
+# imported, the package is already importable and sys.path is left alone
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, NamedStyle
+from openpyxl.utils import get_column_letter, column_index_from_string
+from openpyxl.writer.excel import ExcelWriter
+from openpyxl.xml import LXML
 from agents.state import EquityResearchState
+from utils.files import write_atomically
 from utils.logger import logger
 
+try:
+    import xlsxwriter
+    from xlsxwriter.utility import xl_cell_to_rowcol
+except ImportError:  # Optional faster engine; openpyxl write-only is the fallback
+    xlsxwriter = None
+
+# openpyxl serialises through lxml's C writer when it is usable and falls
+# back to the much slower pure-Python xml.etree otherwise.
+if xlsxwriter is None and not LXML:
+    logger.warning(
+        "⚠️ lxml not available to openpyxl; Excel export will use the slower "
+        "pure-Python XML writer. Run: pip install lxml"
+    )
+
+
+# Shared cell styles. Reusing one instance per style lets openpyxl dedupe
+# them in its style table instead of hashing a fresh object for every cell.
+# Colours are 8-digit ARGB so the alpha channel is explicitly opaque.
+_BRAND_COLOR = "FF366092"
+_HEADER_FILL = PatternFill(start_color=_BRAND_COLOR, end_color=_BRAND_COLOR, fill_type="solid")
+_HEADER_FONT = Font(bold=True, color="FFFFFFFF")
+_COMPARISON_FILL = PatternFill(start_color="FFD3D3D3", end_color="FFD3D3D3", fill_type="solid")
+_CENTER = Alignment(horizontal="center", vertical="center")
+_RIGHT = Alignment(horizontal="right")
+_LABEL_FONT = Font(bold=True)
+_TITLE_FONT = Font(bold=True, size=16, color=_BRAND_COLOR)
+_SECTION_FONT = Font(bold=True, size=14, color=_BRAND_COLOR)
+_CAT_FONT = Font(bold=True, size=12, color=_BRAND_COLOR)
+_BUY_FONT = Font(bold=True, size=12, color="FF008000")  # Green
+_SELL_FONT = Font(bold=True, size=12, color="FFFF0000")  # Red
+_HOLD_FONT = Font(bold=True, size=12, color="FFFFA500")  # Orange
+
+# Colour-coded recommendation styles, registered on each openpyxl workbook
+# and applied by name rather than by building a font per workbook
+_REC_STYLES = {
+    'buy': NamedStyle(name='rec_buy', font=_BUY_FONT),
+    'sell': NamedStyle(name='rec_sell', font=_SELL_FONT),
+    'hold': NamedStyle(name='rec_hold', font=_HOLD_FONT),
+}
+
+# Style tags used in sheet payloads, resolved to cell attributes when the
+# payload is written. A tagged value is a ``(tag, value)`` tuple.
+_CELL_STYLES = {
+    'title': {'font': _TITLE_FONT},
+    'section': {'font': _SECTION_FONT},
+    'category': {'font': _CAT_FONT},
+    'label': {'font': _LABEL_FONT},
+    'header': {'font': _HEADER_FONT, 'fill': _HEADER_FILL, 'alignment': _CENTER},
+    'comparison': {'font': _LABEL_FONT, 'fill': _COMPARISON_FILL},
+    'right': {'alignment': _RIGHT},
+    'center': {'alignment': _CENTER},
+    'int': {'number_format': '0'},
+    'num': {'number_format': '#,##0.00'},
+    'date': {'number_format': 'yyyy-mm-dd'},
+}
+
+# The same style tags expressed as XlsxWriter format properties
+_XLSXWRITER_FORMATS = {
+    'title': {'bold': True, 'font_size': 16, 'font_color': '#366092'},
+    'section': {'bold': True, 'font_size': 14, 'font_color': '#366092'},
+    'category': {'bold': True, 'font_size': 12, 'font_color': '#366092'},
+    'label': {'bold': True},
+    'header': {'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#366092',
+               'align': 'center', 'valign': 'vcenter'},
+    'comparison': {'bold': True, 'bg_color': '#D3D3D3'},
+    'right': {'align': 'right'},
+    'center': {'align': 'center', 'valign': 'vcenter'},
+    'buy': {'bold': True, 'font_size': 12, 'font_color': '#008000'},
+    'sell': {'bold': True, 'font_size': 12, 'font_color': '#FF0000'},
+    'hold': {'bold': True, 'font_size': 12, 'font_color': '#FFA500'},
+    'int': {'num_format': '0'},
+    'num': {'num_format': '#,##0.00'},
+    'date': {'num_format': 'yyyy-mm-dd'},
+}
+
+# Below this many DataFrame rows in the state, process start-up and
+# pickling cost more than building the sheets serially.
+_PARALLEL_ROW_THRESHOLD = 20_000
+
+# Deflate level for the openpyxl archive. Level 1 saves roughly twice as
+# fast as the zipfile default for a slightly larger file.
+_ZIP_COMPRESSLEVEL = 1
+
 
 def generate_excel_workbook(state: EquityResearchState, output_dir: str = "output") -> str:
     """
     Generate comprehensive Excel workbook with all data and analysis.
-    
+
     Creates a multi-sheet .xlsx file with:
     1. Summary - Key metrics and recommendation
     2. Financial Ratios - All calculated ratios
@@ -35,14 +137,17 @@ def generate_excel_workbook(state: EquityResearchState, output_dir: str = "outpu
     7. Dividends - Dividend history
     8. Valuation - Beta, CAPM, DDM calculations
     9. News - Recent developments
-    
+
+    Data sheets (ratios, statements, prices, dividends, news) are left out
+    when the state has no data for them.
+
     Args:
         state: Complete EquityResearchState with all data and analysis
         output_dir: Directory to save the workbook (default: "output")
-    
+
     Returns:
         str: Path to generated Excel workbook
-    
+
     Example:
         >>> from agents import run_research_workflow
         >>> state = run_research_workflow("RELIANCE")
@@ -52,200 +157,333 @@ def generate_excel_workbook(state: EquityResearchState, output_dir: str = "outpu
     logger.info(f"\n{'='*70}")
     logger.info(f"📊 GENERATING EXCEL WORKBOOK: {state['company_name']} ({state['ticker']})")
     logger.info(f"{'='*70}\n")
-    
+
     # Create output directory
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
-    
-    # Initialize workbook
-    wb = Workbook()
-    wb.remove(wb.active)  # Remove default sheet
-    
-    # 1. Summary Sheet
-    logger.info("📝 Step 1/9: Creating Summary sheet...")
-    _add_summary_sheet(wb, state)
-    
-    # 2. Financial Ratios
-    logger.info("📝 Step 2/9: Adding Financial Ratios sheet...")
-    _add_ratios_sheet(wb, state)
-    
-    # 3. Income Statement
-    logger.info("📝 Step 3/9: Adding Income Statement sheet...")
-    _add_income_statement_sheet(wb, state)
-    
-    # 4. Balance Sheet
-    logger.info("📝 Step 4/9: Adding Balance Sheet sheet...")
-    _add_balance_sheet_sheet(wb, state)
-    
-    # 5. Cash Flow
-    logger.info("📝 Step 5/9: Adding Cash Flow sheet...")
-    _add_cash_flow_sheet(wb, state)
-    
-    # 6. Stock Prices
-    logger.info("📝 Step 6/9: Adding Stock Prices sheet...")
-    _add_stock_prices_sheet(wb, state)
-    
-    # 7. Dividends
-    logger.info("📝 Step 7/9: Adding Dividends sheet...")
-    _add_dividends_sheet(wb, state)
-    
-    # 8. Valuation
-    logger.info("📝 Step 8/9: Adding Valuation sheet...")
-    _add_valuation_sheet(wb, state)
-    
-    # 9. News
-    logger.info("📝 Step 9/9: Adding News sheet...")
-    _add_news_sheet(wb, state)
-    
-    # Save workbook
+
+    # Build sheet payloads, then write them with the fastest available engine
+    payloads = _build_payloads(state)
+
     filename = f"Equity_Research_Data_{state['ticker']}_{datetime.now().strftime('%Y%m%d')}.xlsx"
     filepath = output_path / filename
-    wb.save(str(filepath))
-    
+
+    # Serialise in memory, then swap the finished file into place so readers
+    # never see a partially written workbook
+    buffer = io.BytesIO()
+    if xlsxwriter is not None:
+        _save_with_xlsxwriter(payloads, buffer)
+    else:
+        _save_with_openpyxl(payloads, buffer)
+    write_atomically(buffer, filepath)
+
     logger.success(f"✅ Excel workbook generated: {filepath}")
     logger.info(f"   File size: {filepath.stat().st_size / 1024:.2f} KB")
-    logger.info(f"   Sheets: {len(wb.sheetnames)}")
-    
+    logger.info(f"   Sheets: {len(payloads)}")
+
     return str(filepath)
 
 
-def _style_header_row(ws, row_num: int, num_cols: int):
-    """Apply styling to header row."""
-    fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    font = Font(bold=True, color="FFFFFF")
-    alignment = Alignment(horizontal="center", vertical="center")
-    
-    for col in range(1, num_cols + 1):
-        cell = ws.cell(row=row_num, column=col)
-        cell.fill = fill
-        cell.font = font
-        cell.alignment = alignment
+def _build_payloads(state: EquityResearchState) -> List[Dict[str, Any]]:
+    """
+    Build every sheet payload, in a process pool for data-heavy states.
+
+    Args:
+        state: Complete EquityResearchState
+
+    Returns:
+        List[Dict[str, Any]]: Payloads of non-empty sheets in workbook order
+    """
+    facts = _extract_scalar_facts(state)
+    builders = [builder for _, builder in _SHEET_BUILDERS]
+    results = None
+
+    if _state_row_count(state) >= _PARALLEL_ROW_THRESHOLD:
+        try:
+            workers = min(len(builders), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(builder, state, facts) for builder in builders]
+                results = [future.result() for future in futures]
+        # Unpicklable state values surface as PicklingError, TypeError or
+        # AttributeError depending on the object
+        except (BrokenProcessPool, OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning(f"⚠️ Parallel sheet build failed ({e}); building serially")
+
+    if results is None:
+        results = [builder(state, facts) for builder in builders]
+
+    payloads = []
+    for (name, _), payload in zip(_SHEET_BUILDERS, results):
+        if payload is None:
+            logger.info("⏭️  Skipping {} sheet (no data)", name)
+        else:
+            payloads.append(payload)
+    return payloads
+
+
+def _extract_scalar_facts(state: EquityResearchState) -> Dict[str, Any]:
+    """
+    Read the scalar values shared by the Summary and Valuation sheets once.
+
+    Args:
+        state: Complete EquityResearchState
+
+    Returns:
+        Dict[str, Any]: Latest close, market cap, beta, cost of equity,
+            DDM result, company info and overall recommendation
+    """
+    stock_prices = state.get('stock_prices')
+    has_prices = stock_prices is not None and not stock_prices.empty
+    company_info = state.get('company_info') or {}
+
+    return {
+        'has_prices': has_prices,
+        'current_price': float(stock_prices['Close'].iat[-1]) if has_prices else 0.0,
+        'market_cap_b': (company_info.get('marketCap') or 0) / 1e9,
+        'beta': state.get('beta') or 0,
+        'cost_of_equity': state.get('cost_of_equity') or 0,
+        'ddm': state.get('ddm_valuation') or {},
+        'company_info': company_info,
+        'recommendation': state.get('valuation_recommendation', 'N/A'),
+    }
+
+
+def _state_row_count(state: EquityResearchState) -> int:
+    """Count DataFrame rows carried by the state."""
+    frames = [state.get('stock_prices'), state.get('dividends'), state.get('news')]
+    frames += list((state.get('financial_statements') or {}).values())
+    return sum(len(df) for df in frames if isinstance(df, pd.DataFrame))
+
+
+def _payload(name: str, rows: list, widths: Optional[Dict[str, float]] = None,
+             merged: Optional[List[str]] = None,
+             column_formats: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Assemble a sheet payload."""
+    return {
+        'name': name,
+        'rows': rows,
+        'widths': widths or {},
+        'merged': merged or [],
+        'column_formats': column_formats or {},
+    }
+
+
+def _log_steps(payloads: List[Dict[str, Any]]):
+    """Yield payloads in order, logging one progress step per sheet."""
+    total = len(payloads)
+    for step, payload in enumerate(payloads, 1):
+        # Brace arguments are only formatted if the record is emitted
+        logger.info("📝 Step {}/{}: Adding {} sheet...", step, total, payload['name'])
+        yield payload
+
+
+def _save_with_xlsxwriter(payloads: List[Dict[str, Any]], target: io.BytesIO):
+    """
+    Write sheet payloads with XlsxWriter.
+
+    XlsxWriter emits cell XML directly instead of going through openpyxl's
+    cell and style objects, which makes it considerably faster for the
+    value-heavy DataFrame sheets.
+
+    Args:
+        payloads: Sheet payloads in workbook order
+        target: Binary buffer to write the workbook into
+    """
+    # Payload text is data, never formulas or links
+    workbook = xlsxwriter.Workbook(target, {
+        'in_memory': True,
+        'strings_to_formulas': False,
+        'strings_to_urls': False,
+        'strings_to_numbers': False,
+    })
+    formats = {tag: workbook.add_format(props) for tag, props in _XLSXWRITER_FORMATS.items()}
+
+    for payload in _log_steps(payloads):
+        worksheet = workbook.add_worksheet(payload['name'])
+
+        # Column formats apply to every cell written without its own format
+        column_formats = payload['column_formats']
+        for letter in payload['widths'].keys() | column_formats.keys():
+            tag = column_formats.get(letter)
+            worksheet.set_column(f"{letter}:{letter}", payload['widths'].get(letter),
+                                 formats[tag] if tag else None)
+
+        rows = payload['rows']
+        for r_idx, row in enumerate(rows):
+            for c_idx, value in enumerate(row):
+                if isinstance(value, tuple):
+                    tag, value = value
+                    worksheet.write(r_idx, c_idx, value, formats[tag])
+                elif value is not None:
+                    worksheet.write(r_idx, c_idx, value)
+
+        for cell_range in payload['merged']:
+            first, last = cell_range.split(':')
+            first_row, first_col = xl_cell_to_rowcol(first)
+            last_row, last_col = xl_cell_to_rowcol(last)
+            tag, value = rows[first_row][first_col]
+            worksheet.merge_range(first_row, first_col, last_row, last_col, value, formats[tag])
+
+    workbook.close()
+
+
+def _save_with_openpyxl(payloads: List[Dict[str, Any]], target: io.BytesIO):
+    """
+    Write sheet payloads with openpyxl in write-only mode.
+
+    Args:
+        payloads: Sheet payloads in workbook order
+        target: Binary buffer to write the workbook into
+    """
+    wb = Workbook(write_only=True)
+    for style in _REC_STYLES.values():
+        wb.add_named_style(style)
+
+    for payload in _log_steps(payloads):
+        _write_payload(wb, payload)
+
+    # Same as wb.save() (openpyxl.writer.excel.save_workbook), but with a
+    # faster deflate level on the archive. ExcelWriter is openpyxl-internal,
+    # so this needs re-checking on openpyxl upgrades. The modified stamp is
+    # naive UTC, as openpyxl writes it with a 'Z' suffix.
+    wb.properties.modified = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+    archive = zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED,
+                              allowZip64=True, compresslevel=_ZIP_COMPRESSLEVEL)
+    ExcelWriter(wb, archive).save()
+
+
+def _write_payload(wb: Workbook, payload: Dict[str, Any]):
+    """Stream a sheet payload into a new write-only worksheet."""
+    ws = wb.create_sheet(payload['name'])
+
+    # Column widths and formats must be set before the first row is streamed
+    for letter, width in payload['widths'].items():
+        ws.column_dimensions[letter].width = width
+
+    column_tags = {}
+    for letter, tag in payload['column_formats'].items():
+        ws.column_dimensions[letter].number_format = _CELL_STYLES[tag]['number_format']
+        column_tags[column_index_from_string(letter) - 1] = tag
+
+    # openpyxl cells only render a number format they carry themselves, so
+    # plain values in formatted columns are tagged with the column default
+    for row in payload['rows']:
+        ws.append([
+            _to_cell(ws, (column_tags[c_idx], value)
+                     if c_idx in column_tags and value is not None and not isinstance(value, tuple)
+                     else value)
+            for c_idx, value in enumerate(row)
+        ])
+
+    for cell_range in payload['merged']:
+        ws.merged_cells.add(cell_range)
 
 
-def _add_summary_sheet(wb: Workbook, state: EquityResearchState):
-    """Add summary sheet with key metrics."""
-    ws = wb.create_sheet("Summary", 0)
-    
+def _to_cell(ws, value):
+    """Resolve a ``(tag, value)`` payload entry to a styled write-only cell."""
+    if not isinstance(value, tuple):
+        return value
+
+    tag, value = value
+    cell = WriteOnlyCell(ws, value=value)
+    if tag in _REC_STYLES:
+        cell.style = _REC_STYLES[tag].name
+        return cell
+    for attr, style in _CELL_STYLES[tag].items():
+        setattr(cell, attr, style)
+    return cell
+
+
+def _label_rows(pairs) -> list:
+    """Rows of bold label followed by a plain value."""
+    return [[('label', label), value] for label, value in pairs]
+
+
+def _build_summary_payload(state: EquityResearchState, facts: Dict[str, Any]) -> Dict[str, Any]:
+    """Build summary sheet with key metrics."""
+    company_info = facts['company_info']
+
     # Title
-    ws['A1'] = "EQUITY RESEARCH SUMMARY"
-    ws['A1'].font = Font(bold=True, size=16, color="366092")
-    ws.merge_cells('A1:D1')
-    
+    rows = [[('title', "EQUITY RESEARCH SUMMARY")], []]
+
     # Company info
-    company_info = state.get('company_info', {})
-    stock_prices = state.get('stock_prices')
-    
-    ws['A3'] = "Company:"
-    ws['B3'] = state.get('company_name', state['ticker'])
-    ws['A4'] = "Ticker:"
-    ws['B4'] = state['ticker']
-    ws['A5'] = "Sector:"
-    ws['B5'] = company_info.get('sector', 'N/A')
-    ws['A6'] = "Industry:"
-    ws['B6'] = company_info.get('industry', 'N/A')
-    ws['A7'] = "Report Date:"
-    ws['B7'] = datetime.now().strftime("%Y-%m-%d")
-    
-    # Style labels
-    for row in range(3, 8):
-        ws.cell(row=row, column=1).font = Font(bold=True)
-    
+    rows += _label_rows([
+        ("Company:", state.get('company_name', state['ticker'])),
+        ("Ticker:", state['ticker']),
+        ("Sector:", company_info.get('sector', 'N/A')),
+        ("Industry:", company_info.get('industry', 'N/A')),
+        ("Report Date:", datetime.now().strftime("%Y-%m-%d")),
+    ])
+    rows.append([])
+
     # Market data
-    ws['A9'] = "MARKET DATA"
-    ws['A9'].font = Font(bold=True, size=14, color="366092")
-    
-    current_price = stock_prices['Close'].iloc[-1] if stock_prices is not None and not stock_prices.empty else 0
-    market_cap = company_info.get('marketCap', 0) / 1e9 if company_info.get('marketCap') else 0
-    
-    ws['A10'] = "Current Price:"
-    ws['B10'] = f"₹{current_price:.2f}"
-    ws['A11'] = "Market Cap:"
-    ws['B11'] = f"₹{market_cap:.2f}B"
-    ws['A12'] = "52-Week High:"
-    ws['B12'] = f"₹{company_info.get('fiftyTwoWeekHigh', 'N/A')}"
-    ws['A13'] = "52-Week Low:"
-    ws['B13'] = f"₹{company_info.get('fiftyTwoWeekLow', 'N/A')}"
-    
-    for row in range(10, 14):
-        ws.cell(row=row, column=1).font = Font(bold=True)
-    
+    rows.append([('section', "MARKET DATA")])
+
+    rows += _label_rows([
+        ("Current Price:", f"₹{facts['current_price']:.2f}"),
+        ("Market Cap:", f"₹{facts['market_cap_b']:.2f}B"),
+        ("52-Week High:", f"₹{company_info.get('fiftyTwoWeekHigh', 'N/A')}"),
+        ("52-Week Low:", f"₹{company_info.get('fiftyTwoWeekLow', 'N/A')}"),
+    ])
+    rows.append([])
+
     # Valuation metrics
-    ws['A15'] = "VALUATION METRICS"
-    ws['A15'].font = Font(bold=True, size=14, color="366092")
-    
-    beta = state.get('beta', 0)
-    cost_of_equity = state.get('cost_of_equity', 0)
-    ddm = state.get('ddm_valuation', {})
-    
-    ws['A16'] = "Beta:"
-    ws['B16'] = f"{beta:.3f}" if beta else "N/A"
-    ws['A17'] = "Cost of Equity:"
-    ws['B17'] = f"{cost_of_equity:.2%}" if cost_of_equity else "N/A"
-    ws['A18'] = "Fair Value (DDM):"
-    ws['B18'] = f"₹{ddm.get('fair_value', 0):.2f}" if ddm and ddm.get('applicable') else "N/A"
-    ws['A19'] = "Upside/Downside:"
-    ws['B19'] = f"{ddm.get('upside_downside', 0):.1%}" if ddm and ddm.get('applicable') else "N/A"
-    
-    for row in range(16, 20):
-        ws.cell(row=row, column=1).font = Font(bold=True)
-    
+    rows.append([('section', "VALUATION METRICS")])
+
+    beta = facts['beta']
+    cost_of_equity = facts['cost_of_equity']
+    ddm = facts['ddm']
+
+    rows += _label_rows([
+        ("Beta:", f"{beta:.3f}" if beta else "N/A"),
+        ("Cost of Equity:", f"{cost_of_equity:.2%}" if cost_of_equity else "N/A"),
+        ("Fair Value (DDM):", f"₹{ddm.get('fair_value', 0):.2f}" if ddm and ddm.get('applicable') else "N/A"),
+        ("Upside/Downside:", f"{ddm.get('upside_downside', 0):.1%}" if ddm and ddm.get('applicable') else "N/A"),
+    ])
+    rows.append([])
+
     # Recommendation
-    ws['A21'] = "RECOMMENDATION"
-    ws['A21'].font = Font(bold=True, size=14, color="366092")
-    
-    recommendation = state.get('valuation_recommendation', 'N/A')
-    ws['A22'] = recommendation
-    ws['A22'].font = Font(bold=True, size=12)
-    
+    rows.append([('section', "RECOMMENDATION")])
+
+    recommendation = facts['recommendation']
+
     # Color code recommendation
-    if 'Buy' in recommendation:
-        ws['A22'].font = Font(bold=True, size=12, color="008000")  # Green
-    elif 'Sell' in recommendation:
-        ws['A22'].font = Font(bold=True, size=12, color="FF0000")  # Red
-    else:
-        ws['A22'].font = Font(bold=True, size=12, color="FFA500")  # Orange
-    
-    # Adjust column widths
-    ws.column_dimensions['A'].width = 20
-    ws.column_dimensions['B'].width = 30
+    rec_tag = 'buy' if 'Buy' in recommendation else 'sell' if 'Sell' in recommendation else 'hold'
+    rows.append([(rec_tag, recommendation)])
+
+    return _payload("Summary", rows, widths={'A': 20, 'B': 30}, merged=['A1:D1'])
 
 
-def _add_ratios_sheet(wb: Workbook, state: EquityResearchState):
-    """Add financial ratios sheet with year-on-year comparison."""
-    ws = wb.create_sheet("Financial Ratios")
-    
+def _build_ratios_payload(state: EquityResearchState, facts: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build financial ratios sheet with year-on-year comparison."""
     ratios_by_year = state.get('ratios_by_year', [])
     ratios = state.get('ratios', {})  # Fallback to latest period
-    
+
     if not ratios_by_year and not ratios:
-        ws['A1'] = "No ratio data available"
-        return
-    
-    # Title
-    ws['A1'] = "FINANCIAL RATIOS ANALYSIS (Year-on-Year)"
-    ws['A1'].font = Font(bold=True, size=14, color="366092")
-    
+        return None
+
+    title = [('section', "FINANCIAL RATIOS ANALYSIS (Year-on-Year)")]
+
     # If we have year-on-year data, show multi-period comparison
     if ratios_by_year:
-        # Merge title across all columns
         num_periods = len(ratios_by_year)
-        ws.merge_cells(start_row=1, start_column=1, end_row=1, end_column=num_periods + 1)
-        
+
+        # Adjust column widths
+        widths = {'A': 35}
+        for idx in range(num_periods):
+            widths[get_column_letter(idx + 2)] = 15  # B, C, ..., Z, AA, ...
+
         # Add column headers (dates)
-        ws.cell(row=3, column=1, value="Ratio").font = Font(bold=True, color="FFFFFF")
-        ws.cell(row=3, column=1).fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        
+        header = [('header', "Ratio")]
+
         for idx, year_data in enumerate(ratios_by_year):
-            col = idx + 2
             # Extract year from date (e.g., "2024-03-31" -> "FY 2024")
             date_str = year_data.get('date', '')
             year = date_str[:4] if date_str else f"Period {idx}"
-            ws.cell(row=3, column=col, value=f"FY {year}").font = Font(bold=True, color="FFFFFF")
-            ws.cell(row=3, column=col).fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            ws.cell(row=3, column=col).alignment = Alignment(horizontal="center")
-        
-        row = 4
-        
+            header.append(('header', f"FY {year}"))
+
+        rows = [title, [], header]
+
         # Define ratio categories
         categories = [
             ('LIQUIDITY RATIOS', ['current_ratio', 'quick_ratio', 'cash_ratio']),
@@ -254,500 +492,416 @@ def _add_ratios_sheet(wb: Workbook, state: EquityResearchState):
             ('PROFITABILITY RATIOS', ['gross_profit_margin', 'operating_profit_margin', 'net_profit_margin', 'return_on_assets', 'return_on_equity', 'return_on_invested_capital']),
             ('VALUATION RATIOS', ['pe_ratio', 'pb_ratio', 'dividend_yield'])
         ]
-        
+
+        # Format the whole ratio x period grid at once: two decimals, a "%"
+        # suffix on margin/return ratios, and "N/A" where a value is missing
+        all_names = [name for _, names in categories for name in names]
+        values = (
+            pd.DataFrame([year_data.get('ratios', {}) for year_data in ratios_by_year])
+            .reindex(columns=all_names)
+            .apply(pd.to_numeric, errors='coerce')
+            .to_numpy(dtype=float)
+            .T
+        )
+        # Only NaN is blanked for formatting; +/-inf keep printing as "inf"
+        missing = np.isnan(values)
+        formatted = np.char.mod('%.2f', np.nan_to_num(values, posinf=np.inf, neginf=-np.inf))
+        is_pct = np.array([['margin' in name or 'return' in name] for name in all_names])
+        formatted = np.where(is_pct, np.char.add(formatted, '%'), formatted)
+        formatted = np.where(missing, 'N/A', formatted).tolist()
+        tags = np.where(missing, 'center', 'right').tolist()
+        grid = {
+            name: list(zip(name_tags, name_values))
+            for name, name_tags, name_values in zip(all_names, tags, formatted)
+        }
+
         for category_name, ratio_names in categories:
             # Category header
-            ws.cell(row=row, column=1, value=category_name).font = Font(bold=True, size=11, color="366092")
-            row += 1
-            
+            rows.append([('category', category_name)])
+
             # Add ratios for this category
             for ratio_name in ratio_names:
-                ws.cell(row=row, column=1, value=ratio_name.replace('_', ' ').title())
-                
-                # Add values for each period
-                for idx, year_data in enumerate(ratios_by_year):
-                    col = idx + 2
-                    ratio_value = year_data.get('ratios', {}).get(ratio_name)
-                    
-                    if ratio_value is not None:
-                        # Format percentage ratios
-                        if 'margin' in ratio_name or 'return' in ratio_name:
-                            ws.cell(row=row, column=col, value=f"{ratio_value:.2f}%")
-                        else:
-                            ws.cell(row=row, column=col, value=f"{ratio_value:.2f}")
-                        ws.cell(row=row, column=col).alignment = Alignment(horizontal="right")
-                    else:
-                        ws.cell(row=row, column=col, value="N/A")
-                        ws.cell(row=row, column=col).alignment = Alignment(horizontal="center")
-                
-                row += 1
-            
-            row += 1  # Blank row between categories
-        
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 35
-        for idx in range(num_periods):
-            col_letter = chr(66 + idx)  # B, C, D, etc.
-            ws.column_dimensions[col_letter].width = 15
-    
-    else:
-        # Fallback to single-period display (old format)
-        ws.merge_cells('A1:C1')
-        row = 3
-        
-        # Liquidity Ratios
-        ws.cell(row=row, column=1, value="LIQUIDITY RATIOS")
-        ws.cell(row=row, column=1).font = Font(bold=True, size=12, color="366092")
-        row += 1
-        
-        for name, value in ratios.get('liquidity', {}).items():
-            ws.cell(row=row, column=1, value=name.replace('_', ' ').title())
-            ws.cell(row=row, column=2, value=f"{value:.2f}" if value is not None else "N/A")
-            row += 1
-        
-        row += 1
-        
-        # Efficiency Ratios
-        ws.cell(row=row, column=1, value="EFFICIENCY RATIOS")
-        ws.cell(row=row, column=1).font = Font(bold=True, size=12, color="366092")
-        row += 1
-        
-        for name, value in ratios.get('efficiency', {}).items():
-            ws.cell(row=row, column=1, value=name.replace('_', ' ').title())
-            ws.cell(row=row, column=2, value=f"{value:.2f}" if value is not None else "N/A")
-            row += 1
-        
-        row += 1
-        
-        # Solvency Ratios
-        ws.cell(row=row, column=1, value="SOLVENCY/LEVERAGE RATIOS")
-        ws.cell(row=row, column=1).font = Font(bold=True, size=12, color="366092")
-        row += 1
-        
-        for name, value in ratios.get('solvency', {}).items():
-            ws.cell(row=row, column=1, value=name.replace('_', ' ').title())
-            ws.cell(row=row, column=2, value=f"{value:.2f}" if value is not None else "N/A")
-            row += 1
-        
-        row += 1
-        
-        # Profitability Ratios
-        ws.cell(row=row, column=1, value="PROFITABILITY RATIOS")
-        ws.cell(row=row, column=1).font = Font(bold=True, size=12, color="366092")
-        row += 1
-        
-        for name, value in ratios.get('profitability', {}).items():
-            ws.cell(row=row, column=1, value=name.replace('_', ' ').title())
-            ws.cell(row=row, column=2, value=f"{value:.2f}%" if value is not None and ('margin' in name or 'return' in name) else f"{value:.2f}" if value is not None else "N/A")
-            row += 1
-        
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 30
-        ws.column_dimensions['B'].width = 15
+                rows.append([ratio_name.replace('_', ' ').title()] + grid[ratio_name])
+
+            rows.append([])  # Blank row between categories
 
+        return _payload("Financial Ratios", rows, widths=widths,
+                        merged=[f"A1:{get_column_letter(num_periods + 1)}1"])
 
-def _add_income_statement_sheet(wb: Workbook, state: EquityResearchState):
-    """Add income statement sheet."""
-    ws = wb.create_sheet("Income Statement")
-    
+    # Fallback to single-period display (old format)
+    rows = [title, []]
+    sections = [
+        ("LIQUIDITY RATIOS", 'liquidity'),
+        ("EFFICIENCY RATIOS", 'efficiency'),
+        ("SOLVENCY/LEVERAGE RATIOS", 'solvency'),
+        ("PROFITABILITY RATIOS", 'profitability'),
+    ]
+
+    for idx, (category_name, key) in enumerate(sections):
+        if idx:
+            rows.append([])
+        rows.append([('category', category_name)])
+
+        for name, value in ratios.get(key, {}).items():
+            if value is None:
+                formatted = "N/A"
+            elif key == 'profitability' and ('margin' in name or 'return' in name):
+                formatted = f"{value:.2f}%"
+            else:
+                formatted = f"{value:.2f}"
+            rows.append([name.replace('_', ' ').title(), formatted])
+
+    return _payload("Financial Ratios", rows, widths={'A': 30, 'B': 15}, merged=['A1:C1'])
+
+
+def _with_period_labels(statement: pd.DataFrame) -> pd.DataFrame:
+    """Relabel a statement's period-end date columns as 'YYYY-MM-DD' strings."""
+    if isinstance(statement.columns, pd.DatetimeIndex):
+        return statement.set_axis(statement.columns.strftime('%Y-%m-%d'), axis=1)
+    return statement
+
+
+def _build_income_statement_payload(state: EquityResearchState, facts: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build income statement sheet."""
     financial_statements = state.get('financial_statements', {})
     income = financial_statements.get('income_statement')
-    
+
     if income is None or income.empty:
-        ws['A1'] = "No income statement data available"
-        return
-    
-    # Title
-    ws['A1'] = "INCOME STATEMENT (₹ Crores)"
-    ws['A1'].font = Font(bold=True, size=14, color="366092")
-    
-    # Add dataframe to sheet
-    _add_dataframe_to_sheet(ws, income, start_row=3)
+        return None
 
+    return _dataframe_payload("Income Statement", _with_period_labels(income), title="INCOME STATEMENT (₹ Crores)")
 
-def _add_balance_sheet_sheet(wb: Workbook, state: EquityResearchState):
-    """Add balance sheet sheet."""
-    ws = wb.create_sheet("Balance Sheet")
-    
+
+def _build_balance_sheet_payload(state: EquityResearchState, facts: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build balance sheet sheet."""
     financial_statements = state.get('financial_statements', {})
     balance = financial_statements.get('balance_sheet')
-    
+
     if balance is None or balance.empty:
-        ws['A1'] = "No balance sheet data available"
-        return
-    
-    # Title
-    ws['A1'] = "BALANCE SHEET (₹ Crores)"
-    ws['A1'].font = Font(bold=True, size=14, color="366092")
-    
-    # Add dataframe to sheet
-    _add_dataframe_to_sheet(ws, balance, start_row=3)
+        return None
 
+    return _dataframe_payload("Balance Sheet", _with_period_labels(balance), title="BALANCE SHEET (₹ Crores)")
 
-def _add_cash_flow_sheet(wb: Workbook, state: EquityResearchState):
-    """Add cash flow sheet."""
-    ws = wb.create_sheet("Cash Flow")
-    
+
+def _build_cash_flow_payload(state: EquityResearchState, facts: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build cash flow sheet."""
     financial_statements = state.get('financial_statements', {})
     cashflow = financial_statements.get('cash_flow')
-    
+
     if cashflow is None or cashflow.empty:
-        ws['A1'] = "No cash flow data available"
-        return
-    
-    # Title
-    ws['A1'] = "CASH FLOW STATEMENT (₹ Crores)"
-    ws['A1'].font = Font(bold=True, size=14, color="366092")
-    
-    # Add dataframe to sheet
-    _add_dataframe_to_sheet(ws, cashflow, start_row=3)
+        return None
 
+    return _dataframe_payload("Cash Flow", _with_period_labels(cashflow), title="CASH FLOW STATEMENT (₹ Crores)")
 
-def _add_stock_prices_sheet(wb: Workbook, state: EquityResearchState):
-    """Add stock prices sheet."""
-    ws = wb.create_sheet("Stock Prices")
-    
+
+def _build_stock_prices_payload(state: EquityResearchState, facts: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build stock prices sheet."""
     stock_prices = state.get('stock_prices')
-    
+
     if stock_prices is None or stock_prices.empty:
-        ws['A1'] = "No stock price data available"
-        return
-    
-    # Title
-    ws['A1'] = "HISTORICAL STOCK PRICES"
-    ws['A1'].font = Font(bold=True, size=14, color="366092")
-    
-    # Select relevant columns
-    price_df = stock_prices[['Open', 'High', 'Low', 'Close', 'Volume']].copy()
-    price_df.index.name = 'Date'
-    
-    # Add to sheet (limit to recent data for readability)
-    _add_dataframe_to_sheet(ws, price_df.tail(100), start_row=3)
-
-
-def _add_dividends_sheet(wb: Workbook, state: EquityResearchState):
-    """Add dividends sheet."""
-    ws = wb.create_sheet("Dividends")
-    
+        return None
+
+    # Limit to recent data for readability, then select relevant columns;
+    # the payload builder only reads, so no copy of the full history is needed
+    price_df = (
+        stock_prices.tail(100)[['Open', 'High', 'Low', 'Close', 'Volume']]
+        .rename_axis('Date')
+    )
+
+    return _dataframe_payload("Stock Prices", price_df, title="HISTORICAL STOCK PRICES")
+
+
+def _build_dividends_payload(state: EquityResearchState, facts: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build dividends sheet."""
     dividends = state.get('dividends')
-    
+
     if dividends is None or dividends.empty:
-        ws['A1'] = "No dividend history available (company may not pay dividends)"
-        return
-    
-    # Title
-    ws['A1'] = "DIVIDEND HISTORY"
-    ws['A1'].font = Font(bold=True, size=14, color="366092")
-    
-    # Add to sheet
-    _add_dataframe_to_sheet(ws, dividends, start_row=3)
+        return None
 
+    return _dataframe_payload("Dividends", dividends, title="DIVIDEND HISTORY")
 
-def _add_valuation_sheet(wb: Workbook, state: EquityResearchState):
-    """Add valuation analysis sheet."""
-    ws = wb.create_sheet("Valuation")
-    
+
+def _valuation_section(title: str, pairs) -> list:
+    """Rows for a valuation section: title, bold-labelled rows, blank row."""
+    return [[('category', title)]] + _label_rows(pairs) + [[]]
+
+
+def _build_valuation_payload(state: EquityResearchState, facts: Dict[str, Any]) -> Dict[str, Any]:
+    """Build valuation analysis sheet."""
     # Title
-    ws['A1'] = "VALUATION ANALYSIS"
-    ws['A1'].font = Font(bold=True, size=14, color="366092")
-    
+    rows = [[('section', "VALUATION ANALYSIS")], []]
+
+    has_prices = facts['has_prices']
+    current_price = facts['current_price']
+
     # Beta Analysis
-    ws['A3'] = "BETA ANALYSIS"
-    ws['A3'].font = Font(bold=True, size=12, color="366092")
-    
-    beta = state.get('beta', 0)
+    beta = facts['beta']
     correlation = state.get('correlation_with_market', 0)
-    
-    ws['A4'] = "Beta (vs NIFTY 50):"
-    ws['B4'] = f"{beta:.3f}" if beta else "N/A"
-    ws['A5'] = "Interpretation:"
-    ws['B5'] = "Aggressive" if beta and beta > 1 else "Defensive" if beta else "N/A"
-    ws['A6'] = "Correlation:"
-    ws['B6'] = f"{correlation:.3f}" if correlation else "N/A"
-    
+
+    rows += _valuation_section("BETA ANALYSIS", [
+        ("Beta (vs NIFTY 50):", f"{beta:.3f}" if beta else "N/A"),
+        ("Interpretation:", "Aggressive" if beta and beta > 1 else "Defensive" if beta else "N/A"),
+        ("Correlation:", f"{correlation:.3f}" if correlation else "N/A"),
+    ])
+
     # CAPM
-    ws['A8'] = "COST OF EQUITY (CAPM)"
-    ws['A8'].font = Font(bold=True, size=12, color="366092")
-    
-    from config.settings import RISK_FREE_RATE, EXPECTED_MARKET_RETURN
-    cost_of_equity = state.get('cost_of_equity', 0)
-    
-    ws['A9'] = "Risk-Free Rate:"
-    ws['B9'] = f"{RISK_FREE_RATE:.2%}"
-    ws['A10'] = "Expected Market Return:"
-    ws['B10'] = f"{EXPECTED_MARKET_RETURN:.2%}"
-    ws['A11'] = "Beta:"
-    ws['B11'] = f"{beta:.3f}" if beta else "N/A"
-    ws['A12'] = "Cost of Equity:"
-    ws['B12'] = f"{cost_of_equity:.2%}" if cost_of_equity else "N/A"
-    
+    from config.settings import get_settings
+    settings = get_settings()
+    cost_of_equity = facts['cost_of_equity']
+
+    rows += _valuation_section("COST OF EQUITY (CAPM)", [
+        ("Risk-Free Rate:", f"{settings.risk_free_rate:.2%}"),
+        ("Expected Market Return:", f"{settings.expected_market_return:.2%}"),
+        ("Beta:", f"{beta:.3f}" if beta else "N/A"),
+        ("Cost of Equity:", f"{cost_of_equity:.2%}" if cost_of_equity else "N/A"),
+    ])
+
     # DDM
-    ws['A14'] = "DIVIDEND DISCOUNT MODEL (DDM)"
-    ws['A14'].font = Font(bold=True, size=12, color="366092")
-    
-    ddm = state.get('ddm_valuation', {})
-    
+    ddm = facts['ddm']
+
     if ddm and ddm.get('applicable'):
-        ws['A15'] = "Current Dividend (D0):"
-        ws['B15'] = f"₹{ddm.get('d0_current_dividend', 0):.2f}"
-        ws['A16'] = "Next Dividend (D1):"
-        ws['B16'] = f"₹{ddm.get('d1_next_dividend', 0):.2f}"
-        ws['A17'] = "Growth Rate:"
-        ws['B17'] = f"{ddm.get('growth_rate', 0):.2%}"
-        ws['A18'] = "Fair Value:"
-        ws['B18'] = f"₹{ddm.get('fair_value', 0):.2f}"
-        
-        stock_prices = state.get('stock_prices')
-        if stock_prices is not None and not stock_prices.empty:
-            current_price = stock_prices['Close'].iloc[-1]
-            ws['A19'] = "Current Price:"
-            ws['B19'] = f"₹{current_price:.2f}"
-            ws['A20'] = "Upside/Downside:"
-            ws['B20'] = f"{ddm.get('upside_downside', 0):.1%}"
+        pairs = [
+            ("Current Dividend (D0):", f"₹{ddm.get('d0_current_dividend', 0):.2f}"),
+            ("Next Dividend (D1):", f"₹{ddm.get('d1_next_dividend', 0):.2f}"),
+            ("Growth Rate:", f"{ddm.get('growth_rate', 0):.2%}"),
+            ("Fair Value:", f"₹{ddm.get('fair_value', 0):.2f}"),
+        ]
+        if has_prices:
+            pairs += [
+                ("Current Price:", f"₹{current_price:.2f}"),
+                ("Upside/Downside:", f"{ddm.get('upside_downside', 0):.1%}"),
+            ]
     else:
-        ws['A15'] = "DDM Not Applicable:"
-        ws['B15'] = ddm.get('reason', 'Company does not pay dividends')
-    
+        pairs = [("DDM Not Applicable:", ddm.get('reason', 'Company does not pay dividends'))]
+    rows += _valuation_section("DIVIDEND DISCOUNT MODEL (DDM)", pairs)
+
     # WACC
-    ws['A22'] = "WEIGHTED AVERAGE COST OF CAPITAL (WACC)"
-    ws['A22'].font = Font(bold=True, size=12, color="366092")
-    
     wacc_data = state.get('wacc', {})
-    
+
     if wacc_data:
-        ws['A23'] = "Cost of Equity:"
-        ws['B23'] = f"{wacc_data.get('cost_of_equity', 0):.2%}"
-        ws['A24'] = "Cost of Debt (After-Tax):"
-        ws['B24'] = f"{wacc_data.get('cost_of_debt_after_tax', 0):.2%}"
-        ws['A25'] = "Weight of Equity (E/V):"
-        ws['B25'] = f"{wacc_data.get('weight_equity', 0):.1%}"
-        ws['A26'] = "Weight of Debt (D/V):"
-        ws['B26'] = f"{wacc_data.get('weight_debt', 0):.1%}"
-        ws['A27'] = "WACC:"
-        ws['B27'] = f"{wacc_data.get('wacc', 0):.2%}"
+        pairs = [
+            ("Cost of Equity:", f"{wacc_data.get('cost_of_equity', 0):.2%}"),
+            ("Cost of Debt (After-Tax):", f"{wacc_data.get('cost_of_debt_after_tax', 0):.2%}"),
+            ("Weight of Equity (E/V):", f"{wacc_data.get('weight_equity', 0):.1%}"),
+            ("Weight of Debt (D/V):", f"{wacc_data.get('weight_debt', 0):.1%}"),
+            ("WACC:", f"{wacc_data.get('wacc', 0):.2%}"),
+        ]
     else:
-        ws['A23'] = "WACC Not Calculated"
-        ws['B23'] = "Missing data"
-    
+        pairs = [("WACC Not Calculated", "Missing data")]
+    rows += _valuation_section("WEIGHTED AVERAGE COST OF CAPITAL (WACC)", pairs)
+
     # FCF-based DCF
-    ws['A29'] = "DCF VALUATION - FREE CASH FLOW (FCF)"
-    ws['A29'].font = Font(bold=True, size=12, color="366092")
-    
     fcf_dcf = state.get('dcf_fcf_valuation', {})
-    
+
     if fcf_dcf and fcf_dcf.get('applicable'):
-        ws['A30'] = "Method:"
-        ws['B30'] = "FCF to Firm (values entire firm)"
-        ws['A31'] = "FCF Growth Rate:"
-        ws['B31'] = f"{fcf_dcf.get('fcf_growth_rate', 0):.2%}"
-        ws['A32'] = "Terminal Growth Rate:"
-        ws['B32'] = f"{fcf_dcf.get('terminal_growth_rate', 0):.2%}"
-        ws['A33'] = "WACC (Discount Rate):"
-        ws['B33'] = f"{fcf_dcf.get('wacc', 0):.2%}"
-        ws['A34'] = "Enterprise Value:"
-        ws['B34'] = f"₹{fcf_dcf.get('enterprise_value', 0):,.0f} Cr"
-        ws['A35'] = "Net Debt:"
-        ws['B35'] = f"₹{fcf_dcf.get('net_debt', 0):,.0f} Cr"
-        ws['A36'] = "Equity Value:"
-        ws['B36'] = f"₹{fcf_dcf.get('equity_value', 0):,.0f} Cr"
-        ws['A37'] = "Fair Value per Share:"
-        ws['B37'] = f"₹{fcf_dcf.get('fair_value_per_share', 0):.2f}"
-        
-        stock_prices = state.get('stock_prices')
-        if stock_prices is not None and not stock_prices.empty:
-            current_price = stock_prices['Close'].iloc[-1]
-            ws['A38'] = "Current Price:"
-            ws['B38'] = f"₹{current_price:.2f}"
-            ws['A39'] = "Upside/Downside:"
-            ws['B39'] = f"{fcf_dcf.get('upside_downside', 0):.1%}"
-            ws['A40'] = "Recommendation:"
-            ws['B40'] = fcf_dcf.get('recommendation', 'N/A')
+        pairs = [
+            ("Method:", "FCF to Firm (values entire firm)"),
+            ("FCF Growth Rate:", f"{fcf_dcf.get('fcf_growth_rate', 0):.2%}"),
+            ("Terminal Growth Rate:", f"{fcf_dcf.get('terminal_growth_rate', 0):.2%}"),
+            ("WACC (Discount Rate):", f"{fcf_dcf.get('wacc', 0):.2%}"),
+            ("Enterprise Value:", f"₹{fcf_dcf.get('enterprise_value', 0):,.0f} Cr"),
+            ("Net Debt:", f"₹{fcf_dcf.get('net_debt', 0):,.0f} Cr"),
+            ("Equity Value:", f"₹{fcf_dcf.get('equity_value', 0):,.0f} Cr"),
+            ("Fair Value per Share:", f"₹{fcf_dcf.get('fair_value_per_share', 0):.2f}"),
+        ]
+        if has_prices:
+            pairs += [
+                ("Current Price:", f"₹{current_price:.2f}"),
+                ("Upside/Downside:", f"{fcf_dcf.get('upside_downside', 0):.1%}"),
+                ("Recommendation:", fcf_dcf.get('recommendation', 'N/A')),
+            ]
     else:
-        ws['A30'] = "FCF DCF Not Applicable:"
-        ws['B30'] = fcf_dcf.get('reason', 'Missing data')
-    
+        pairs = [("FCF DCF Not Applicable:", fcf_dcf.get('reason', 'Missing data'))]
+    rows += _valuation_section("DCF VALUATION - FREE CASH FLOW (FCF)", pairs)
+
     # FCFE-based DCF
-    ws['A42'] = "DCF VALUATION - FREE CASH FLOW TO EQUITY (FCFE)"
-    ws['A42'].font = Font(bold=True, size=12, color="366092")
-    
     fcfe_dcf = state.get('dcf_fcfe_valuation', {})
-    
+
     if fcfe_dcf and fcfe_dcf.get('applicable'):
-        ws['A43'] = "Method:"
-        ws['B43'] = "FCFE (values equity directly)"
-        ws['A44'] = "FCFE Growth Rate:"
-        ws['B44'] = f"{fcfe_dcf.get('fcfe_growth_rate', 0):.2%}"
-        ws['A45'] = "Terminal Growth Rate:"
-        ws['B45'] = f"{fcfe_dcf.get('terminal_growth_rate', 0):.2%}"
-        ws['A46'] = "Cost of Equity (Discount Rate):"
-        ws['B46'] = f"{fcfe_dcf.get('cost_of_equity', 0):.2%}"
-        ws['A47'] = "Equity Value:"
-        ws['B47'] = f"₹{fcfe_dcf.get('equity_value', 0):,.0f} Cr"
-        ws['A48'] = "Fair Value per Share:"
-        ws['B48'] = f"₹{fcfe_dcf.get('fair_value_per_share', 0):.2f}"
-        
-        stock_prices = state.get('stock_prices')
-        if stock_prices is not None and not stock_prices.empty:
-            current_price = stock_prices['Close'].iloc[-1]
-            ws['A49'] = "Current Price:"
-            ws['B49'] = f"₹{current_price:.2f}"
-            ws['A50'] = "Upside/Downside:"
-            ws['B50'] = f"{fcfe_dcf.get('upside_downside', 0):.1%}"
-            ws['A51'] = "Recommendation:"
-            ws['B51'] = fcfe_dcf.get('recommendation', 'N/A')
+        pairs = [
+            ("Method:", "FCFE (values equity directly)"),
+            ("FCFE Growth Rate:", f"{fcfe_dcf.get('fcfe_growth_rate', 0):.2%}"),
+            ("Terminal Growth Rate:", f"{fcfe_dcf.get('terminal_growth_rate', 0):.2%}"),
+            ("Cost of Equity (Discount Rate):", f"{fcfe_dcf.get('cost_of_equity', 0):.2%}"),
+            ("Equity Value:", f"₹{fcfe_dcf.get('equity_value', 0):,.0f} Cr"),
+            ("Fair Value per Share:", f"₹{fcfe_dcf.get('fair_value_per_share', 0):.2f}"),
+        ]
+        if has_prices:
+            pairs += [
+                ("Current Price:", f"₹{current_price:.2f}"),
+                ("Upside/Downside:", f"{fcfe_dcf.get('upside_downside', 0):.1%}"),
+                ("Recommendation:", fcfe_dcf.get('recommendation', 'N/A')),
+            ]
     else:
-        ws['A43'] = "FCFE DCF Not Applicable:"
-        ws['B43'] = fcfe_dcf.get('reason', 'Missing data')
-    
+        pairs = [("FCFE DCF Not Applicable:", fcfe_dcf.get('reason', 'Missing data'))]
+    rows += _valuation_section("DCF VALUATION - FREE CASH FLOW TO EQUITY (FCFE)", pairs)
+
     # Valuation Comparison
-    ws['A53'] = "VALUATION COMPARISON"
-    ws['A53'].font = Font(bold=True, size=12, color="366092")
-    
-    stock_prices = state.get('stock_prices')
-    current_price = stock_prices['Close'].iloc[-1] if stock_prices is not None and not stock_prices.empty else 0
-    
-    ws['A54'] = "Method"
-    ws['B54'] = "Fair Value"
-    ws['C54'] = "Current Price"
-    ws['D54'] = "Upside/Downside"
-    ws['E54'] = "Recommendation"
-    
-    # Header formatting
-    for col in ['A', 'B', 'C', 'D', 'E']:
-        ws[f'{col}54'].font = Font(bold=True)
-        ws[f'{col}54'].fill = PatternFill(start_color="D3D3D3", end_color="D3D3D3", fill_type="solid")
-    
-    row = 55
-    
-    # DDM
-    if ddm and ddm.get('applicable'):
-        ws[f'A{row}'] = "DDM (Dividend Discount)"
-        ws[f'B{row}'] = f"₹{ddm.get('fair_value', 0):.2f}"
-        ws[f'C{row}'] = f"₹{current_price:.2f}"
-        ws[f'D{row}'] = f"{ddm.get('upside_downside', 0):.1%}"
-        ws[f'E{row}'] = ddm.get('recommendation', 'N/A')
-        row += 1
-    
-    # FCF DCF
-    if fcf_dcf and fcf_dcf.get('applicable'):
-        ws[f'A{row}'] = "DCF (FCF to Firm)"
-        ws[f'B{row}'] = f"₹{fcf_dcf.get('fair_value_per_share', 0):.2f}"
-        ws[f'C{row}'] = f"₹{current_price:.2f}"
-        ws[f'D{row}'] = f"{fcf_dcf.get('upside_downside', 0):.1%}"
-        ws[f'E{row}'] = fcf_dcf.get('recommendation', 'N/A')
-        row += 1
-    
-    # FCFE DCF
-    if fcfe_dcf and fcfe_dcf.get('applicable'):
-        ws[f'A{row}'] = "DCF (FCFE to Equity)"
-        ws[f'B{row}'] = f"₹{fcfe_dcf.get('fair_value_per_share', 0):.2f}"
-        ws[f'C{row}'] = f"₹{current_price:.2f}"
-        ws[f'D{row}'] = f"{fcfe_dcf.get('upside_downside', 0):.1%}"
-        ws[f'E{row}'] = fcfe_dcf.get('recommendation', 'N/A')
-        row += 1
-    
-    # Style all labels
-    for r in range(4, row):
-        ws.cell(row=r, column=1).font = Font(bold=True)
-    
-    ws.column_dimensions['A'].width = 35
-    ws.column_dimensions['B'].width = 20
-    ws.column_dimensions['C'].width = 20
-    ws.column_dimensions['D'].width = 18
-    ws.column_dimensions['E'].width = 20
-
-
-def _add_news_sheet(wb: Workbook, state: EquityResearchState):
-    """Add news/developments sheet."""
-    ws = wb.create_sheet("News")
-    
+    rows.append([('category', "VALUATION COMPARISON")])
+    rows.append([
+        ('comparison', header)
+        for header in ("Method", "Fair Value", "Current Price", "Upside/Downside", "Recommendation")
+    ])
+
+    for method, valuation, fair_value_key in (
+        ("DDM (Dividend Discount)", ddm, 'fair_value'),
+        ("DCF (FCF to Firm)", fcf_dcf, 'fair_value_per_share'),
+        ("DCF (FCFE to Equity)", fcfe_dcf, 'fair_value_per_share'),
+    ):
+        if valuation and valuation.get('applicable'):
+            rows.append([
+                ('label', method),
+                f"₹{valuation.get(fair_value_key, 0):.2f}",
+                f"₹{current_price:.2f}",
+                f"{valuation.get('upside_downside', 0):.1%}",
+                valuation.get('recommendation', 'N/A'),
+            ])
+
+    return _payload("Valuation", rows, widths={'A': 35, 'B': 20, 'C': 20, 'D': 18, 'E': 20})
+
+
+def _build_news_payload(state: EquityResearchState, facts: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build news/developments sheet."""
     news = state.get('news')
-    
+
     if news is None or news.empty:
-        ws['A1'] = "No news data available"
-        return
-    
-    # Title
-    ws['A1'] = "RECENT NEWS & DEVELOPMENTS"
-    ws['A1'].font = Font(bold=True, size=14, color="366092")
-    
+        return None
+
     # Prepare news dataframe
     news_df = news[['published', 'title', 'source']].copy()
     news_df['published'] = news_df['published'].dt.strftime('%Y-%m-%d')
     news_df.columns = ['Date', 'Headline', 'Source']
-    
-    # Add to sheet (limit to most recent)
-    _add_dataframe_to_sheet(ws, news_df.head(50), start_row=3)
-
-
-def _add_dataframe_to_sheet(ws, df: pd.DataFrame, start_row: int = 1):
-    """Add a pandas DataFrame to worksheet with formatting."""
-    # Convert DataFrame to rows
-    for r_idx, row in enumerate(dataframe_to_rows(df, index=True, header=True), start_row):
-        for c_idx, value in enumerate(row, 1):
-            cell = ws.cell(row=r_idx, column=c_idx)
-            
-            # Format value
-            if pd.notna(value):
-                if isinstance(value, (int, float)):
-                    if abs(value) > 1e6:
-                        cell.value = value / 1e7
-                        cell.number_format = '#,##0.00'
-                    else:
-                        cell.value = value
-                        cell.number_format = '#,##0.00' if isinstance(value, float) else '0'
-                else:
-                    cell.value = str(value)
-            
-            # Header row styling
-            if r_idx == start_row + 1:
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                cell.alignment = Alignment(horizontal="center")
-    
-    # Adjust column widths
-    for column in ws.columns:
-        max_length = 0
-        column_letter = column[0].column_letter
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 50)
-        ws.column_dimensions[column_letter].width = adjusted_width
+
+    # Limit to most recent
+    return _dataframe_payload("News", news_df.head(50), title="RECENT NEWS & DEVELOPMENTS",
+                              values_only=True)
+
+
+def _dataframe_payload(name: str, df: pd.DataFrame, title: str,
+                       values_only: bool = False) -> Dict[str, Any]:
+    """
+    Build a sheet payload for a pandas DataFrame below a title row.
+
+    Large values are scaled to crores and missing values blanked for the
+    whole frame at once; each DataFrame row becomes one payload row.
+
+    Args:
+        name: Sheet name
+        df: DataFrame to write (index is written as the first column)
+        title: Bold title placed in A1, followed by a blank row
+        values_only: Write values as-is, skipping crore scaling (for frames
+            that are already presentation-ready, like News)
+
+    Returns:
+        Dict[str, Any]: Sheet payload
+    """
+    # Tuples in payload rows are style tags, so MultiIndex labels are
+    # flattened to plain strings once up front
+    if isinstance(df.columns, pd.MultiIndex):
+        df = df.set_axis([' '.join(map(str, col)) for col in df.columns], axis=1)
+    if isinstance(df.index, pd.MultiIndex):
+        index_name = ' / '.join(str(name) for name in df.index.names if name is not None) or None
+        df = df.set_axis(pd.Index([' '.join(map(str, key)) for key in df.index], name=index_name), axis=0)
+    if isinstance(df.index, pd.DatetimeIndex) and df.index.tz is not None:
+        df = df.set_axis(df.index.tz_localize(None), axis=0)
+
+    # Scale values above 10 lakh to crores in one vectorised pass
+    numeric_cols = [] if values_only else df.select_dtypes(include='number').columns
+    scaled = df if values_only else df.copy()
+    if len(numeric_cols):
+        numeric = df[numeric_cols]
+        scaled[numeric_cols] = numeric.where(numeric.abs() <= 1e6, numeric / 1e7)
+
+    # Neither engine accepts tz-aware datetimes, so yfinance's exchange-local
+    # dates are written as their wall-clock time
+    tz_cols = df.select_dtypes(include='datetimetz').columns
+    if len(tz_cols):
+        if scaled is df:
+            scaled = df.copy()
+        for col in tz_cols:
+            scaled[col] = scaled[col].dt.tz_localize(None)
+
+    # Integers keep a plain format, floats get two decimals, datetimes a
+    # date format (Excel stores them as serial numbers), text none
+    formats = {'i': 'int', 'u': 'int', 'f': 'num', 'M': 'date'}
+    number_formats = [formats.get(df.index.dtype.kind)] + [
+        formats.get(dtype.kind) for dtype in scaled.dtypes
+    ]
+
+    scaled = scaled.astype(object).where(scaled.notna(), None)
+    if df.index.dtype.kind not in formats:
+        scaled.index = df.index.astype(str)
+
+    header = [df.index.name] + [str(col) for col in df.columns]
+
+    # Column widths come from the frame in one pass (capped at 50 chars);
+    # write-only sheets need them before the first row is appended.
+    text = scaled.astype(str).where(scaled.notna(), '')
+    value_widths = [scaled.index.astype(str).str.len().max()] + [
+        text.iloc[:, c_idx].str.len().max() for c_idx in range(text.shape[1])
+    ]
+    widths = [max(len(title), len(str(header[0] or '')), value_widths[0])] + [
+        max(len(label), width) for label, width in zip(header[1:], value_widths[1:])
+    ]
+
+    rows = [[('section', title)], [], [('header', value) for value in header]]
+    rows += list(scaled.itertuples(index=True, name=None))
+
+    return _payload(
+        name,
+        rows,
+        widths={
+            get_column_letter(c_idx): min(width + 2, 50) for c_idx, width in enumerate(widths, 1)
+        },
+        column_formats={
+            get_column_letter(c_idx): tag for c_idx, tag in enumerate(number_formats, 1) if tag
+        },
+    )
+
+
+# Sheet builders in workbook order
+_SHEET_BUILDERS = (
+    ("Summary", _build_summary_payload),
+    ("Financial Ratios", _build_ratios_payload),
+    ("Income Statement", _build_income_statement_payload),
+    ("Balance Sheet", _build_balance_sheet_payload),
+    ("Cash Flow", _build_cash_flow_payload),
+    ("Stock Prices", _build_stock_prices_payload),
+    ("Dividends", _build_dividends_payload),
+    ("Valuation", _build_valuation_payload),
+    ("News", _build_news_payload),
+)
 
 
 if __name__ == "__main__":
     """Test Excel workbook generation."""
     print("Testing Excel Workbook Generator...")
-    
+
     from agents.state import create_initial_state
     from agents.nodes import collect_data_node, analyze_node
-    
+
     test_ticker = "RELIANCE"
-    
+
     try:
         print(f"\n🧪 Testing with {test_ticker}...")
-        
+
         # Collect data and analyze
         print("📊 Collecting data...")
         state = create_initial_state(test_ticker, "Reliance Industries")
         data_updates = collect_data_node(state)
         state.update(data_updates)
-        
+
         print("📈 Analyzing...")
         analysis_updates = analyze_node(state)
         state.update(analysis_updates)
-        
+
         # Generate Excel workbook
         print("\n📊 Generating Excel workbook...")
         filepath = generate_excel_workbook(state)
-        
+
         print(f"\n✅ Test completed!")
         print(f"   Workbook saved: {filepath}")
-        
+
     except Exception as e:
         print(f"\n❌ Test failed: {e}")
         import traceback
@@ -6,22 +6,76 @@ the assignment template structure with proper formatting, tables,
 and styling.
 """
 
+from __future__ import annotations
+
+import io
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, Any
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from copy import deepcopy
 from docx import Document
+from docx.document import Document as DocumentProxy
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.style import WD_STYLE_TYPE
-from agents.state import EquityResearchState
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from utils.files import write_atomically
 from utils.logger import logger
 
+if TYPE_CHECKING:
+    # pandas and the state module are only needed once a report is built
+    import pandas as pd
+    from agents.state import EquityResearchState
+
+# Recommendation colours: green for Buy, red for Sell, orange otherwise
+_REC_COLORS = {
+    'Buy': RGBColor(0, 128, 0),
+    'Sell': RGBColor(255, 0, 0),
+    'Hold': RGBColor(255, 165, 0),
+}
+
+# Company details table: (label, company_info key, default when missing)
+_COMPANY_DETAIL_SPEC = (
+    ('Sector', 'sector', 'N/A'),
+    ('Industry', 'industry', 'N/A'),
+    ('Employees', 'fullTimeEmployees', 'N/A'),
+    ('Website', 'website', 'N/A'),
+    ('Country', 'country', 'India'),
+)
+
+# DDM table rows before the current price:
+# (label, ddm_valuation key, prefix, format spec)
+_DDM_SPEC = (
+    ('Current Dividend (D0)', 'd0_current_dividend', '₹', '.2f'),
+    ('Next Dividend (D1)', 'd1_next_dividend', '₹', '.2f'),
+    ('Growth Rate', 'growth_rate', '', '.2%'),
+    ('Fair Value', 'fair_value', '₹', '.2f'),
+)
+
+# Ratio categories and their subsection headings in section 3
+_RATIO_SECTIONS = (
+    ('liquidity', '3.1 Liquidity Ratios'),
+    ('efficiency', '3.2 Efficiency Ratios'),
+    ('solvency', '3.3 Solvency/Leverage Ratios'),
+    ('profitability', '3.4 Profitability Ratios'),
+)
+
+# Ratios (as named by tools.ratio_calculator) that are stored as percentages
+_PCT_RATIOS = frozenset({
+    'gross_profit_margin',
+    'operating_profit_margin',
+    'net_profit_margin',
+    'return_on_assets',
+    'return_on_equity',
+    'return_on_invested_capital',
+})
+
 
 def generate_word_report(state: EquityResearchState, output_dir: str = "output") -> str:
     """
@@ -60,62 +114,110 @@ def generate_word_report(state: EquityResearchState, output_dir: str = "output")
     # Get report date
     report_date = datetime.now().strftime("%B %d, %Y")
     
+    # Values shared by several sections, read from the state once
+    facts = _extract_report_facts(state)
+    
+    # Sections are built off-tree and spliced into the document body once
+    content = _detached_document(doc)
+    
     # 1. Cover Page
     logger.info("📝 Step 1/10: Creating cover page...")
-    _add_cover_page(doc, state, report_date)
+    _add_cover_page(content, state, facts, report_date)
     
     # 2. Table of Contents (placeholder)
     logger.info("📝 Step 2/10: Adding table of contents...")
-    _add_table_of_contents(doc)
+    _add_table_of_contents(content)
     
     # 3. Executive Summary
     logger.info("📝 Step 3/10: Adding executive summary...")
-    _add_executive_summary(doc, state)
+    _add_executive_summary(content, state)
     
     # 4. Company Overview
     logger.info("📝 Step 4/10: Adding company overview...")
-    _add_company_overview(doc, state)
+    _add_company_overview(content, state, facts)
     
     # 5. Financial Analysis
     logger.info("📝 Step 5/10: Adding financial analysis...")
-    _add_financial_analysis(doc, state)
+    _add_financial_analysis(content, state, facts)
     
     # 6. Valuation Analysis
     logger.info("📝 Step 6/10: Adding valuation analysis...")
-    _add_valuation_analysis(doc, state)
+    _add_valuation_analysis(content, state, facts)
     
     # 7. Risk Analysis
     logger.info("📝 Step 7/10: Adding risk analysis...")
-    _add_risk_analysis(doc, state)
+    _add_risk_analysis(content, state, facts)
     
     # 8. Recent Developments
     logger.info("📝 Step 8/10: Adding recent developments...")
-    _add_recent_developments(doc, state)
+    _add_recent_developments(content, state)
     
     # 9. Investment Recommendation
     logger.info("📝 Step 9/10: Adding investment recommendation...")
-    _add_investment_recommendation(doc, state)
+    _add_investment_recommendation(content, state, facts)
     
     # 10. Appendix (Financial Data Tables)
     logger.info("📝 Step 10/10: Adding appendix...")
-    _add_appendix(doc, state)
+    _add_appendix(content, state)
+    
+    _splice_body(doc, content)
     
     # Save document
     filename = f"Equity_Research_{state['ticker']}_{datetime.now().strftime('%Y%m%d')}.docx"
     filepath = output_path / filename
-    doc.save(str(filepath))
+    
+    # Serialise in memory, then swap the finished file into place; the size
+    # is known from the buffer, so no stat() afterwards
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    write_atomically(buffer, filepath)
     
     logger.success(f"✅ Word report generated: {filepath}")
-    logger.info(f"   File size: {filepath.stat().st_size / 1024:.2f} KB")
+    logger.info(f"   File size: {buffer.getbuffer().nbytes / 1024:.2f} KB")
     
     return str(filepath)
 
 
+def _extract_report_facts(state: EquityResearchState) -> Dict[str, Any]:
+    """
+    Read the values shared by several report sections once.
+
+    Args:
+        state: Complete EquityResearchState
+
+    Returns:
+        Dict[str, Any]: Latest close, company info, ratios, beta, cost of
+            equity, DDM result and overall recommendation
+    """
+    stock_prices = state.get('stock_prices')
+    has_prices = stock_prices is not None and not stock_prices.empty
+
+    return {
+        'current_price': stock_prices['Close'].iat[-1] if has_prices else 0,
+        'company_info': state.get('company_info') or {},
+        'ratios': state.get('ratios') or {},
+        'beta': state.get('beta') or 0,
+        'cost_of_equity': state.get('cost_of_equity') or 0,
+        'ddm': state.get('ddm_valuation') or {},
+        'recommendation': state.get('valuation_recommendation'),
+    }
+
+
+def _rec_color(recommendation: str) -> RGBColor:
+    """Pick the colour for a recommendation string such as 'Strong Buy'."""
+    rec_key = 'Buy' if 'Buy' in recommendation else 'Sell' if 'Sell' in recommendation else 'Hold'
+    return _REC_COLORS[rec_key]
+
+
 def _setup_document_styles(doc: Document):
     """Setup custom styles for the document."""
+    styles = doc.styles
+    
     # Title style
-    if 'Report Title' not in [s.name for s in doc.styles]:
-        title_style = doc.styles.add_style('Report Title', WD_STYLE_TYPE.PARAGRAPH)
+    try:
+        styles['Report Title']
+    except KeyError:
+        title_style = styles.add_style('Report Title', WD_STYLE_TYPE.PARAGRAPH)
         title_style.font.size = Pt(24)
         title_style.font.bold = True
         title_style.font.color.rgb = RGBColor(0, 51, 102)
@@ -123,7 +225,7 @@ def _setup_document_styles(doc: Document):
         title_style.paragraph_format.space_after = Pt(12)
     
     # Heading 1 - Section Headers
-    heading1 = doc.styles['Heading 1']
+    heading1 = styles['Heading 1']
     heading1.font.size = Pt(16)
     heading1.font.bold = True
     heading1.font.color.rgb = RGBColor(0, 51, 102)
@@ -131,7 +233,7 @@ def _setup_document_styles(doc: Document):
     heading1.paragraph_format.space_after = Pt(6)
     
     # Heading 2 - Subsection Headers
-    heading2 = doc.styles['Heading 2']
+    heading2 = styles['Heading 2']
     heading2.font.size = Pt(14)
     heading2.font.bold = True
     heading2.font.color.rgb = RGBColor(0, 76, 153)
@@ -139,7 +241,95 @@ def _setup_document_styles(doc: Document):
     heading2.paragraph_format.space_after = Pt(6)
 
 
-def _add_cover_page(doc: Document, state: EquityResearchState, report_date: str):
+def _detached_document(doc: Document) -> DocumentProxy:
+    """
+    Create an empty, off-tree document that shares ``doc``'s part.
+
+    python-docx inserts every new block in front of the body's ``w:sectPr``,
+    which means a scan of the live body per paragraph or table. Sections are
+    written into this stand-in instead, through the same Document API, and
+    resolve styles against ``doc``. It carries a copy of the page setup so
+    table widths come out the same.
+
+    Args:
+        doc: Document the content will be spliced into
+
+    Returns:
+        DocumentProxy: Detached document to build sections in
+    """
+    body = OxmlElement('w:body')
+    body.append(deepcopy(doc.element.body.sectPr))
+    document = OxmlElement('w:document')
+    document.append(body)
+    return DocumentProxy(document, doc.part)
+
+
+def _splice_body(doc: Document, content: DocumentProxy):
+    """Move the blocks built in ``content`` into ``doc`` in one insertion."""
+    body = doc.element.body
+    blocks = [el for el in content.element.body if el.tag != qn('w:sectPr')]
+    position = body.index(body.sectPr)
+    body[position:position] = blocks
+
+
+def _fast_fill(table, rows_data, bold_header: bool = False):
+    """
+    Fill a freshly added table with text, row by row.
+
+    Setting ``cell.text`` through python-docx recomputes the table grid on
+    every ``table.rows[i].cells[j]`` access. This writes the same
+    ``<w:p><w:r><w:t>`` content straight into the ``<w:tc>`` elements instead.
+
+    Args:
+        table: Table returned by ``doc.add_table``
+        rows_data: Rows of cell strings; short rows leave trailing cells empty
+        bold_header: Make the text in the first row bold
+    """
+    for i, (tr, values) in enumerate(zip(table._tbl.tr_lst, rows_data)):
+        for tc, value in zip(tr.tc_lst, values):
+            tc.clear_content()
+            run = OxmlElement('w:r')
+            if bold_header and i == 0:
+                rPr = OxmlElement('w:rPr')
+                rPr.append(OxmlElement('w:b'))
+                run.append(rPr)
+            text = OxmlElement('w:t')
+            text.text = value
+            if value != value.strip():
+                text.set(qn('xml:space'), 'preserve')
+            run.append(text)
+            paragraph = OxmlElement('w:p')
+            paragraph.append(run)
+            tc.append(paragraph)
+
+
+def _fmt(value, default: str = 'N/A') -> str:
+    """Show a state value, with thousands separators for counts."""
+    if value is None or value == '':
+        return default
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f"{value:,}"
+    return str(value)
+
+
+def _kv_table(doc: Document, pairs, style: str = 'Light Grid Accent 1'):
+    """
+    Add a two-column label/value table.
+
+    Args:
+        doc: Document to add the table to
+        pairs: (label, value) pairs; values are shown with str()
+        style: Table style name
+
+    Returns:
+        The new table
+    """
+    table = doc.add_table(rows=len(pairs), cols=2, style=style)
+    _fast_fill(table, [(label, str(value)) for label, value in pairs])
+    return table
+
+
+def _add_cover_page(doc: Document, state: EquityResearchState, facts: Dict[str, Any], report_date: str):
     """Add professional cover page."""
     # Title
     title = doc.add_paragraph(style='Report Title')
@@ -162,13 +352,12 @@ def _add_cover_page(doc: Document, state: EquityResearchState, report_date: str)
     ticker.paragraph_format.space_after = Pt(36)
     
     # Key metrics table
-    company_info = state.get('company_info', {})
-    stock_prices = state.get('stock_prices')
+    company_info = facts['company_info']
     
     metrics_para = doc.add_paragraph()
     metrics_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
     
-    current_price = stock_prices['Close'].iloc[-1] if stock_prices is not None and not stock_prices.empty else 0
+    current_price = facts['current_price']
     market_cap = company_info.get('marketCap', 0) / 1e9 if company_info.get('marketCap') else 0
     
     metrics_text = f"""
@@ -183,20 +372,16 @@ Industry: {company_info.get('industry', 'N/A')}
     metrics_para.paragraph_format.space_after = Pt(48)
     
     # Recommendation
-    if state.get('valuation_recommendation'):
+    recommendation = facts['recommendation']
+    if recommendation:
         rec_para = doc.add_paragraph()
         rec_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        rec_run = rec_para.add_run(f"RECOMMENDATION: {state['valuation_recommendation']}")
+        rec_run = rec_para.add_run(f"RECOMMENDATION: {recommendation}")
         rec_run.font.size = Pt(14)
         rec_run.font.bold = True
         
         # Color code recommendation
-        if 'Buy' in state['valuation_recommendation']:
-            rec_run.font.color.rgb = RGBColor(0, 128, 0)  # Green
-        elif 'Sell' in state['valuation_recommendation']:
-            rec_run.font.color.rgb = RGBColor(255, 0, 0)  # Red
-        else:
-            rec_run.font.color.rgb = RGBColor(255, 165, 0)  # Orange
+        rec_run.font.color.rgb = _rec_color(recommendation)
         
         rec_para.paragraph_format.space_after = Pt(48)
     
@@ -260,11 +445,11 @@ def _add_executive_summary(doc: Document, state: EquityResearchState):
     doc.add_paragraph()  # Spacing
 
 
-def _add_company_overview(doc: Document, state: EquityResearchState):
+def _add_company_overview(doc: Document, state: EquityResearchState, facts: Dict[str, Any]):
     """Add company overview section."""
     doc.add_heading('2. Company Overview', 1)
     
-    company_info = state.get('company_info', {})
+    company_info = facts['company_info']
     
     # Company description
     if state.get('company_overview_text'):
@@ -279,26 +464,15 @@ def _add_company_overview(doc: Document, state: EquityResearchState):
     # Company details table
     doc.add_heading('Company Details', 2)
     
-    table = doc.add_table(rows=6, cols=2)
-    table.style = 'Light Grid Accent 1'
-    
-    details = [
-        ('Sector', company_info.get('sector', 'N/A')),
-        ('Industry', company_info.get('industry', 'N/A')),
-        ('Employees', f"{company_info.get('fullTimeEmployees', 'N/A'):,}" if company_info.get('fullTimeEmployees') else 'N/A'),
-        ('Website', company_info.get('website', 'N/A')),
-        ('Country', company_info.get('country', 'India')),
-        ('Exchange', 'NSE (National Stock Exchange of India)')
-    ]
+    details = [(label, _fmt(company_info.get(key), default)) for label, key, default in _COMPANY_DETAIL_SPEC]
+    details.append(('Exchange', 'NSE (National Stock Exchange of India)'))
     
-    for i, (label, value) in enumerate(details):
-        table.rows[i].cells[0].text = label
-        table.rows[i].cells[1].text = str(value)
+    _kv_table(doc, details)
     
     doc.add_paragraph()
 
 
-def _add_financial_analysis(doc: Document, state: EquityResearchState):
+def _add_financial_analysis(doc: Document, state: EquityResearchState, facts: Dict[str, Any]):
     """Add financial analysis section."""
     doc.add_heading('3. Financial Analysis', 1)
     
@@ -309,24 +483,13 @@ def _add_financial_analysis(doc: Document, state: EquityResearchState):
         doc.add_paragraph("[Financial analysis commentary will be generated when LLM is configured.]")
     
     # Financial ratios tables
-    ratios = state.get('ratios', {})
+    ratios = facts['ratios']
     
-    if ratios:
-        # Liquidity Ratios
-        doc.add_heading('3.1 Liquidity Ratios', 2)
-        _add_ratio_table(doc, ratios.get('liquidity', {}))
-        
-        # Efficiency Ratios
-        doc.add_heading('3.2 Efficiency Ratios', 2)
-        _add_ratio_table(doc, ratios.get('efficiency', {}))
-        
-        # Solvency Ratios
-        doc.add_heading('3.3 Solvency/Leverage Ratios', 2)
-        _add_ratio_table(doc, ratios.get('solvency', {}))
-        
-        # Profitability Ratios
-        doc.add_heading('3.4 Profitability Ratios', 2)
-        _add_ratio_table(doc, ratios.get('profitability', {}))
+    # Only categories with data get a subsection
+    for category, heading in _RATIO_SECTIONS:
+        if ratios.get(category):
+            doc.add_heading(heading, 2)
+            _add_ratio_table(doc, ratios[category])
     
     doc.add_paragraph()
 
@@ -341,33 +504,27 @@ def _add_ratio_table(doc: Document, ratios: Dict[str, float]):
     table.style = 'Light List Accent 1'
     
     # Header
-    table.rows[0].cells[0].text = "Ratio"
-    table.rows[0].cells[1].text = "Value"
-    
-    # Make header bold
-    for cell in table.rows[0].cells:
-        for paragraph in cell.paragraphs:
-            for run in paragraph.runs:
-                run.font.bold = True
+    rows_data = [("Ratio", "Value")]
     
     # Data
-    for i, (name, value) in enumerate(ratios.items(), 1):
+    for name, value in ratios.items():
         formatted_name = name.replace('_', ' ').title()
-        table.rows[i].cells[0].text = formatted_name
         
         if value is not None:
             # Format based on ratio type
-            if 'margin' in name or 'return' in name:
-                table.rows[i].cells[1].text = f"{value:.2f}%"
+            if name in _PCT_RATIOS:
+                rows_data.append((formatted_name, f"{value:.2f}%"))
             else:
-                table.rows[i].cells[1].text = f"{value:.2f}"
+                rows_data.append((formatted_name, f"{value:.2f}"))
         else:
-            table.rows[i].cells[1].text = "N/A"
+            rows_data.append((formatted_name, "N/A"))
+    
+    _fast_fill(table, rows_data, bold_header=True)
     
     doc.add_paragraph()
 
 
-def _add_valuation_analysis(doc: Document, state: EquityResearchState):
+def _add_valuation_analysis(doc: Document, state: EquityResearchState, facts: Dict[str, Any]):
     """Add valuation analysis section."""
     doc.add_heading('4. Valuation Analysis', 1)
     
@@ -380,10 +537,7 @@ def _add_valuation_analysis(doc: Document, state: EquityResearchState):
     # Beta & Risk Metrics
     doc.add_heading('4.1 Beta and Risk Profile', 2)
     
-    table = doc.add_table(rows=4, cols=2)
-    table.style = 'Light Grid Accent 1'
-    
-    beta = state.get('beta', 0)
+    beta = facts['beta']
     correlation = state.get('correlation_with_market', 0)
     
     risk_data = [
@@ -393,55 +547,42 @@ def _add_valuation_analysis(doc: Document, state: EquityResearchState):
         ('Systematic Risk', 'Above Market' if beta and beta > 1 else 'Below Market' if beta else 'N/A')
     ]
     
-    for i, (label, value) in enumerate(risk_data):
-        table.rows[i].cells[0].text = label
-        table.rows[i].cells[1].text = str(value)
+    _kv_table(doc, risk_data)
     
     # CAPM
     doc.add_heading('4.2 Cost of Equity (CAPM)', 2)
     
-    cost_of_equity = state.get('cost_of_equity', 0)
+    cost_of_equity = facts['cost_of_equity']
     
-    from config.settings import RISK_FREE_RATE, EXPECTED_MARKET_RETURN
-    
-    table = doc.add_table(rows=4, cols=2)
-    table.style = 'Light Grid Accent 1'
+    from config.settings import get_settings
+    settings = get_settings()
     
     capm_data = [
-        ('Risk-Free Rate (Indian G-Sec)', f"{RISK_FREE_RATE:.2%}"),
-        ('Expected Market Return (NIFTY 50)', f"{EXPECTED_MARKET_RETURN:.2%}"),
-        ('Beta', f"{beta:.3f}" if beta else 'N/A'),
-        ('Cost of Equity', f"{cost_of_equity:.2%}" if cost_of_equity else 'N/A')
+        ('Risk-Free Rate (Indian G-Sec)', format(settings.risk_free_rate, '.2%')),
+        ('Expected Market Return (NIFTY 50)', format(settings.expected_market_return, '.2%')),
+        ('Beta', format(beta, '.3f') if beta else 'N/A'),
+        ('Cost of Equity', format(cost_of_equity, '.2%') if cost_of_equity else 'N/A')
     ]
     
-    for i, (label, value) in enumerate(capm_data):
-        table.rows[i].cells[0].text = label
-        table.rows[i].cells[1].text = str(value)
+    _kv_table(doc, capm_data)
     
     # DDM Valuation
     doc.add_heading('4.3 Dividend Discount Model (DDM)', 2)
     
-    ddm = state.get('ddm_valuation', {})
+    ddm = facts['ddm']
     
     if ddm and ddm.get('applicable'):
-        table = doc.add_table(rows=6, cols=2)
-        table.style = 'Light Grid Accent 1'
+        current_price = facts['current_price']
         
-        stock_prices = state.get('stock_prices')
-        current_price = stock_prices['Close'].iloc[-1] if stock_prices is not None and not stock_prices.empty else 0
-        
-        ddm_data = [
-            ('Current Dividend (D0)', f"₹{ddm.get('d0_current_dividend', 0):.2f}"),
-            ('Next Dividend (D1)', f"₹{ddm.get('d1_next_dividend', 0):.2f}"),
-            ('Growth Rate', f"{ddm.get('growth_rate', 0):.2%}"),
-            ('Fair Value', f"₹{ddm.get('fair_value', 0):.2f}"),
-            ('Current Price', f"₹{current_price:.2f}"),
-            ('Upside/Downside', f"{ddm.get('upside_downside', 0):.1%}")
+        # Missing and None values both show as zero
+        ddm_data = [(label, prefix + format(ddm.get(key) or 0, spec))
+                    for label, key, prefix, spec in _DDM_SPEC]
+        ddm_data += [
+            ('Current Price', '₹' + format(current_price, '.2f')),
+            ('Upside/Downside', format(ddm.get('upside_downside') or 0, '.1%'))
         ]
         
-        for i, (label, value) in enumerate(ddm_data):
-            table.rows[i].cells[0].text = label
-            table.rows[i].cells[1].text = str(value)
+        _kv_table(doc, ddm_data)
     else:
         reason = ddm.get('reason', 'DDM not applicable')
         doc.add_paragraph(f"DDM Valuation: {reason}", style='Intense Quote')
@@ -449,7 +590,7 @@ def _add_valuation_analysis(doc: Document, state: EquityResearchState):
     doc.add_paragraph()
 
 
-def _add_risk_analysis(doc: Document, state: EquityResearchState):
+def _add_risk_analysis(doc: Document, state: EquityResearchState, facts: Dict[str, Any]):
     """Add risk analysis section."""
     doc.add_heading('5. Risk Analysis', 1)
     
@@ -461,11 +602,8 @@ def _add_risk_analysis(doc: Document, state: EquityResearchState):
         # Add basic risk metrics table as fallback
         doc.add_heading('Key Risk Metrics', 2)
         
-        ratios = state.get('ratios', {})
-        beta = state.get('beta', 0)
-        
-        table = doc.add_table(rows=4, cols=2)
-        table.style = 'Light Grid Accent 1'
+        ratios = facts['ratios']
+        beta = facts['beta']
         
         risk_metrics = [
             ('Beta (Market Risk)', f"{beta:.3f}" if beta else 'N/A'),
@@ -474,9 +612,7 @@ def _add_risk_analysis(doc: Document, state: EquityResearchState):
             ('Current Ratio', f"{ratios.get('liquidity', {}).get('current_ratio', 'N/A'):.2f}" if ratios.get('liquidity', {}).get('current_ratio') else 'N/A')
         ]
         
-        for i, (label, value) in enumerate(risk_metrics):
-            table.rows[i].cells[0].text = label
-            table.rows[i].cells[1].text = str(value)
+        _kv_table(doc, risk_metrics)
     
     doc.add_paragraph()
 
@@ -493,17 +629,18 @@ def _add_recent_developments(doc: Document, state: EquityResearchState):
         if news is not None and not news.empty:
             doc.add_paragraph("Recent news highlights:")
             
-            for _, row in news.head(10).iterrows():
-                date = row['published'].strftime('%Y-%m-%d')
-                title = row['title']
-                para = doc.add_paragraph(f"• [{date}] {title}", style='List Bullet')
+            import pandas as pd
+            latest = news.head(10)
+            dates = pd.DatetimeIndex(latest['published']).strftime('%Y-%m-%d')
+            for date, title in zip(dates, latest['title'].to_numpy()):
+                doc.add_paragraph(f"• [{date}] {title}", style='List Bullet')
         else:
             doc.add_paragraph("[Recent developments will be included when news data is available.]")
     
     doc.add_paragraph()
 
 
-def _add_investment_recommendation(doc: Document, state: EquityResearchState):
+def _add_investment_recommendation(doc: Document, state: EquityResearchState, facts: Dict[str, Any]):
     """Add investment recommendation section."""
     doc.add_heading('7. Investment Recommendation', 1)
     
@@ -511,7 +648,7 @@ def _add_investment_recommendation(doc: Document, state: EquityResearchState):
         doc.add_paragraph(state['final_recommendation_text'])
     else:
         # Fallback to basic recommendation
-        recommendation = state.get('valuation_recommendation', 'N/A')
+        recommendation = facts['recommendation'] or 'N/A'
         
         doc.add_paragraph(f"Based on our comprehensive analysis, our recommendation is:")
         
@@ -519,20 +656,13 @@ def _add_investment_recommendation(doc: Document, state: EquityResearchState):
         rec_run = rec_para.add_run(f"\n{recommendation}\n")
         rec_run.font.size = Pt(14)
         rec_run.font.bold = True
-        
-        if 'Buy' in recommendation:
-            rec_run.font.color.rgb = RGBColor(0, 128, 0)
-        elif 'Sell' in recommendation:
-            rec_run.font.color.rgb = RGBColor(255, 0, 0)
-        else:
-            rec_run.font.color.rgb = RGBColor(255, 165, 0)
+        rec_run.font.color.rgb = _rec_color(recommendation)
         
         # Add basic rationale
-        ddm = state.get('ddm_valuation', {})
+        ddm = facts['ddm']
         if ddm and ddm.get('applicable'):
             fair_value = ddm.get('fair_value', 0)
-            stock_prices = state.get('stock_prices')
-            current_price = stock_prices['Close'].iloc[-1] if stock_prices is not None and not stock_prices.empty else 0
+            current_price = facts['current_price']
             upside = ddm.get('upside_downside', 0)
             
             doc.add_paragraph(
@@ -580,6 +710,9 @@ def _add_appendix(doc: Document, state: EquityResearchState):
 
 def _add_dataframe_table(doc: Document, df: pd.DataFrame, caption: str):
     """Add a pandas DataFrame as a Word table."""
+    import numpy as np
+    import pandas as pd
+    
     if df.empty:
         doc.add_paragraph("No data available")
         return
@@ -592,28 +725,34 @@ def _add_dataframe_table(doc: Document, df: pd.DataFrame, caption: str):
     table.style = 'Light Grid Accent 1'
     
     # Headers (column dates/periods)
-    table.rows[0].cells[0].text = "Item"
-    for j, col in enumerate(df.columns[:5], 1):
+    header = ["Item"]
+    for col in df.columns[:5]:
         if hasattr(col, 'strftime'):
-            table.rows[0].cells[j].text = col.strftime('%Y-%m-%d')
+            header.append(col.strftime('%Y-%m-%d'))
         else:
-            table.rows[0].cells[j].text = str(col)
-    
-    # Data rows
-    for i, (idx, row) in enumerate(df.head(5).iterrows(), 1):
-        table.rows[i].cells[0].text = str(idx)
-        for j, val in enumerate(row[:5], 1):
-            if pd.notna(val):
-                # Format numbers
-                try:
-                    if abs(val) > 1e6:
-                        table.rows[i].cells[j].text = f"{val/1e7:.2f}Cr"
-                    else:
-                        table.rows[i].cells[j].text = f"{val:.2f}"
-                except:
-                    table.rows[i].cells[j].text = str(val)
-            else:
-                table.rows[i].cells[j].text = "N/A"
+            header.append(str(col))
+    rows_data = [header]
+    
+    # Data rows, formatted as one string matrix; the formatting path is
+    # picked per column from its dtype
+    sub = df.iloc[:5, :5]
+    formatted = np.empty(sub.shape, dtype=object)
+    is_numeric = np.array([pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+                           for dtype in sub.dtypes], dtype=bool)
+    if is_numeric.any():
+        arr = sub.loc[:, is_numeric].to_numpy(dtype=float, na_value=np.nan)
+        big = np.char.add(np.char.mod("%.2f", arr / 1e7), "Cr")
+        values = np.where(np.abs(arr) > 1e6, big, np.char.mod("%.2f", arr))
+        formatted[:, is_numeric] = np.where(np.isnan(arr), "N/A", values)
+    if not is_numeric.all():
+        # Text columns: show values as-is
+        text = sub.loc[:, ~is_numeric]
+        formatted[:, ~is_numeric] = text.astype(str).where(text.notna(), "N/A").to_numpy()
+    
+    for idx, cells in zip(sub.index, formatted.tolist()):
+        rows_data.append([str(idx), *cells])
+    
+    _fast_fill(table, rows_data)
     
     doc.add_paragraph()
 
@@ -5,12 +5,18 @@ Launch script for Equity Research Report Generator UI.
 This script starts the Streamlit web interface.
 """
 
+import os
 import subprocess
 import sys
 from pathlib import Path
 
 def main():
     """Launch Streamlit UI."""
+    # Create the data/outputs directories (and surface invalid settings)
+    # before handing over to Streamlit
+    from config.settings import init_config
+    init_config()
+    
     ui_path = Path(__file__).parent / "ui" / "app.py"
     
     print("🚀 Starting Equity Research Report Generator UI...")
@@ -20,13 +26,26 @@ def main():
     print("Press Ctrl+C to stop the server.")
     print("="*70 + "\n")
     
+    cmd = [
+        sys.executable, "-m", "streamlit", "run",
+        str(ui_path),
+        "--server.port", "8501",
+        "--server.headless", "false"
+    ]
+    
+    # On POSIX, hand this process over to Streamlit instead of waiting on a
+    # child; Streamlit then receives Ctrl+C directly
+    if os.name == "posix":
+        sys.stdout.flush()
+        try:
+            os.execvp(sys.executable, cmd)
+        except OSError as e:
+            print(f"\n❌ Error starting UI: {e}")
+            sys.exit(1)
+    
+    # Windows has no real exec, so keep the launcher as the parent there
     try:
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run",
-            str(ui_path),
-            "--server.port", "8501",
-            "--server.headless", "false"
-        ], check=True)
+        subprocess.run(cmd, check=True)
     except KeyboardInterrupt:
         print("\n\n✋ Shutting down UI...")
     except subprocess.CalledProcessError as e:
@@ -2,30 +2,38 @@
 """Convert DOCX files to Markdown format."""
 
 import mammoth
+import os
 import sys
 from pathlib import Path
 
 
+WRITE_CHUNK_CHARS = 64 * 1024
+
+
 def convert_docx_to_markdown(docx_path, output_path):
     """Convert a DOCX file to Markdown."""
     try:
+        # mammoth's zip reader seeks to each part it needs, so the DOCX is
+        # read lazily; the file is closed before the output is written
         with open(docx_path, "rb") as docx_file:
             result = mammoth.convert_to_markdown(docx_file)
-            markdown = result.value
-            
-            # Write to output file
-            with open(output_path, "w", encoding="utf-8") as md_file:
-                md_file.write(markdown)
-            
-            print(f"✓ Converted: {docx_path} -> {output_path}")
-            
-            # Print any warnings
-            if result.messages:
-                print(f"  Warnings for {docx_path}:")
-                for message in result.messages:
-                    print(f"    - {message}")
-            
-            return True
+        
+        # Write to output file in slices, so the encoder never holds a
+        # second full-size copy of the markdown
+        markdown = result.value
+        with open(output_path, "w", encoding="utf-8") as md_file:
+            for start in range(0, len(markdown), WRITE_CHUNK_CHARS):
+                md_file.write(markdown[start:start + WRITE_CHUNK_CHARS])
+        
+        print(f"✓ Converted: {docx_path} -> {output_path}")
+        
+        # Print any warnings
+        if result.messages:
+            print(f"  Warnings for {docx_path}:")
+            for message in result.messages:
+                print(f"    - {message}")
+        
+        return True
     except Exception as e:
         print(f"✗ Error converting {docx_path}: {e}")
         return False
@@ -42,11 +50,14 @@ def main():
     
     print("Converting DOCX files to Markdown...\n")
     
+    # One directory listing instead of a stat() per file
+    available = {entry.name for entry in os.scandir(base_dir) if entry.is_file()}
+    
     for docx_file, md_file in files:
         docx_path = base_dir / docx_file
         md_path = base_dir / md_file
         
-        if docx_path.exists():
+        if docx_file in available:
             convert_docx_to_markdown(docx_path, md_path)
         else:
             print(f"✗ File not found: {docx_path}")
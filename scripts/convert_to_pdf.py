@@ -1,45 +1,144 @@
 #!/usr/bin/env python3
 """Convert DOCX files to PDF format."""
 
-from docx2pdf import convert
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+import os
+import shutil
+import subprocess
 import sys
+import tempfile
 
+WD_FORMAT_PDF = 17  # Word's SaveAs file format code for PDF
+MAX_ATTEMPTS = 2
 
-def convert_docx_to_pdf(docx_path, pdf_path):
-    """Convert a DOCX file to PDF."""
+
+def convert_docx_to_pdf(docx_path, pdf_path, word=None):
+    """
+    Convert a DOCX file to PDF, retrying once on failure.
+
+    When a running Word instance is given it is reused; otherwise docx2pdf
+    starts its own converter for this file.
+    """
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            if word is not None:
+                doc = word.Documents.Open(str(docx_path), ReadOnly=True)
+                try:
+                    doc.SaveAs(str(pdf_path), FileFormat=WD_FORMAT_PDF)
+                finally:
+                    doc.Close(False)
+            else:
+                from docx2pdf import convert
+                convert(str(docx_path), str(pdf_path))
+            print(f"✓ Converted: {docx_path} -> {pdf_path}")
+            return True
+        except Exception as e:
+            if attempt < MAX_ATTEMPTS:
+                print(f"↻ Retrying {docx_path}: {e}")
+            else:
+                print(f"✗ Error converting {docx_path}: {e}")
+    return False
+
+
+def convert_batch(pairs):
+    """
+    Convert a batch of (docx_path, pdf_path) pairs in one worker process.
+
+    On Windows one Word instance is started for the whole batch instead of
+    once per file; elsewhere each file goes through docx2pdf.
+    """
     try:
-        convert(str(docx_path), str(pdf_path))
-        print(f"✓ Converted: {docx_path} -> {pdf_path}")
-        return True
-    except Exception as e:
-        print(f"✗ Error converting {docx_path}: {e}")
-        return False
+        import pythoncom
+        import win32com.client
+    except ImportError:
+        return [convert_docx_to_pdf(docx_path, pdf_path) for docx_path, pdf_path in pairs]
+
+    pythoncom.CoInitialize()
+    try:
+        word = win32com.client.DispatchEx("Word.Application")
+        word.Visible = False
+        word.DisplayAlerts = 0  # Never block on a modal dialog
+        try:
+            return [convert_docx_to_pdf(docx_path, pdf_path, word) for docx_path, pdf_path in pairs]
+        finally:
+            word.Quit()
+    finally:
+        pythoncom.CoUninitialize()
+
+
+def find_libreoffice():
+    """Return the LibreOffice executable on PATH, or None if it is not installed."""
+    return shutil.which("soffice") or shutil.which("libreoffice")
+
+
+def convert_with_libreoffice(pairs, soffice):
+    """
+    Convert all (docx_path, pdf_path) pairs with a single headless LibreOffice run.
+
+    LibreOffice accepts every input file on one command line, so the office
+    process and its font cache start once for the whole list. Output goes to
+    a scratch directory first because LibreOffice names each PDF after its
+    source file.
+    """
+    with tempfile.TemporaryDirectory() as out_dir:
+        cmd = [soffice, "--headless", "--convert-to", "pdf", "--outdir", out_dir]
+        cmd += [str(docx_path) for docx_path, _ in pairs]
+        try:
+            subprocess.run(cmd, check=True, capture_output=True)
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"✗ LibreOffice conversion failed: {e}")
+
+        results = []
+        for docx_path, pdf_path in pairs:
+            produced = Path(out_dir) / f"{docx_path.stem}.pdf"
+            if produced.exists():
+                shutil.move(str(produced), str(pdf_path))
+                print(f"✓ Converted: {docx_path} -> {pdf_path}")
+                results.append(True)
+            else:
+                print(f"✗ Error converting {docx_path}: no PDF produced")
+                results.append(False)
+        return results
 
 
 def main():
-    base_dir = Path(__file__).parent
-    
+    base_dir = Path(__file__).resolve().parent
+
     # Files to convert
     files = [
         ("Equity Research Report Guidelines.docx", "Equity_Research_Report_Guidelines.pdf"),
         ("Equity Research Report-Template.docx", "Equity_Research_Report_Template.pdf")
     ]
-    
+
     print("Converting DOCX files to PDF...\n")
-    
+
+    # List the script directory once rather than checking each file
+    available = {entry.name for entry in os.scandir(base_dir) if entry.is_file()}
+
+    pairs = []
     for docx_file, pdf_file in files:
         docx_path = base_dir / docx_file
         pdf_path = base_dir / pdf_file
-        
-        if docx_path.exists():
-            convert_docx_to_pdf(docx_path, pdf_path)
+
+        if docx_file in available:
+            pairs.append((docx_path, pdf_path))
         else:
             print(f"✗ File not found: {docx_path}")
-    
+
+    soffice = find_libreoffice()
+    if pairs and soffice:
+        convert_with_libreoffice(pairs, soffice)
+    elif pairs:
+        # Split the files across workers, each converting its share in turn
+        workers = min(os.cpu_count() or 1, len(pairs))
+        batches = [pairs[i::workers] for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for _ in executor.map(convert_batch, batches):
+                pass
+
     print("\nConversion complete!")
 
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,125 @@
+"""
+Shared pytest fixtures for the test suite.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+
+# Test companies (diverse sectors)
+TEST_COMPANIES = [
+    ("RELIANCE", "NSE"),   # Oil & Gas / Telecom / Retail
+    ("TCS", "NSE"),        # IT Services
+    ("INFY", "NSE"),       # IT Services
+    ("HDFCBANK", "NSE"),   # Banking
+    ("ITC", "NSE"),        # FMCG / Tobacco
+]
+
+# Ticker attributes the data tests read; every one is a separate request
+# to Yahoo
+TICKER_FIELDS = (
+    'info', 'financials', 'balance_sheet', 'cashflow', 'dividends', 'quarterly_financials',
+)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-network", action="store_true", default=False,
+        help="run tests marked 'network', which call Yahoo Finance",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "network: test needs internet access (run with --run-network)")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip network tests unless --run-network is given."""
+    if config.getoption("--run-network"):
+        return
+    skip_network = pytest.mark.skip(reason="needs --run-network")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+@pytest.fixture(scope="session")
+def research_graph():
+    """Compiled research workflow graph, built once per test session."""
+    from agents import create_research_graph
+    
+    return create_research_graph()
+
+
+@pytest.fixture
+def initial_state():
+    """Fresh initial state for RELIANCE, as the UI creates it."""
+    from agents import create_initial_state
+    
+    return create_initial_state("RELIANCE", "Reliance Industries Limited")
+
+
+@pytest.fixture(scope="session")
+def date_range():
+    """
+    (start, end) of the 5-year price window shared by every data test.
+
+    The end is today's midnight, so every test (and every xdist worker)
+    asks Yahoo for the same window.
+    """
+    end_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    return end_date - timedelta(days=5*365), end_date
+
+
+@pytest.fixture(scope="session")
+def price_histories(date_range):
+    """
+    5-year price histories of every test company and the market index.
+
+    All of them are fetched in one batched ``yf.download`` request and keyed
+    by suffixed ticker (e.g. "RELIANCE.NS", "^NSEI").
+    """
+    import yfinance as yf
+    from config.settings import DEFAULT_MARKET_INDEX, get_ticker_with_suffix
+    
+    full_tickers = [get_ticker_with_suffix(t, e) for t, e in TEST_COMPANIES]
+    full_tickers.append(DEFAULT_MARKET_INDEX)
+    
+    start_date, end_date = date_range
+    prices = yf.download(full_tickers, start=start_date, end=end_date,
+                         group_by='ticker', threads=True, progress=False)
+    return {t: prices[t].dropna(how='all') for t in full_tickers}
+
+
+@pytest.fixture(scope="session")
+def nifty_history(price_histories):
+    """
+    5-year NIFTY 50 history, for any test that needs the market benchmark.
+
+    Comes from the batched ``price_histories`` download, so beta or
+    correlation tests reuse it without another request.
+    """
+    from config.settings import DEFAULT_MARKET_INDEX
+    
+    return price_histories[DEFAULT_MARKET_INDEX]
+
+
+@pytest.fixture(scope="module", params=TEST_COMPANIES, ids=[t for t, _ in TEST_COMPANIES])
+def stock(request):
+    """
+    yfinance Ticker for one test company, shared by that company's tests.
+
+    The TICKER_FIELDS requests are independent network I/O, so they are
+    issued side by side up front; yfinance keeps the results on the Ticker.
+    """
+    import yfinance as yf
+    from config.settings import get_ticker_with_suffix
+    
+    ticker, exchange = request.param
+    ticker_obj = yf.Ticker(get_ticker_with_suffix(ticker, exchange))
+    
+    with ThreadPoolExecutor(max_workers=len(TICKER_FIELDS)) as executor:
+        for future in [executor.submit(getattr, ticker_obj, field) for field in TICKER_FIELDS]:
+            future.result()
+    return ticker_obj
@@ -0,0 +1,139 @@
+"""
+Test Bloomberg field mapping and merging with synthetic frames (no network).
+"""
+
+import pandas as pd
+import pytest
+
+from tools.bloomberg_mapper import BloombergFieldMapper, merge_bloomberg_yfinance
+
+PERIODS = ["FY2022", "FY2023", "FY2024"]
+
+
+def _statement(fields, periods=PERIODS):
+    """Statement frame with one row per field, valued 1, 2, 3, ... by row."""
+    values = [[float(row)] * len(periods) for row in range(1, len(fields) + 1)]
+    return pd.DataFrame(values, index=pd.Index(fields, dtype=object), columns=periods)
+
+
+@pytest.fixture
+def mapper():
+    return BloombergFieldMapper()
+
+
+def test_map_statement_mapped(mapper):
+    """Known Bloomberg fields are renamed to their yfinance names."""
+    mapped, unmapped, ambiguous = mapper.map_statement(
+        _statement(["Revenue", "Cost of Goods Sold", "Gross Profit"]), "income"
+    )
+
+    assert mapped.index.tolist() == ["Total Revenue", "Cost Of Revenue", "Gross Profit"]
+    assert mapped.index.dtype == object
+    assert mapped.loc["Cost Of Revenue"].tolist() == [2.0, 2.0, 2.0]
+    assert unmapped == [] and ambiguous == []
+
+
+def test_map_statement_unmapped(mapper):
+    """Unknown fields keep their name and are reported as unmapped."""
+    mapped, unmapped, ambiguous = mapper.map_statement(
+        _statement(["Revenue", "Mystery Adjustment"]), "income"
+    )
+
+    assert mapped.index.tolist() == ["Total Revenue", "Mystery Adjustment"]
+    assert unmapped == ["Mystery Adjustment"]
+    assert ambiguous == []
+
+
+def test_map_statement_ambiguous_first_wins(mapper):
+    """When two fields map to one yfinance name, only the first is renamed."""
+    mapped, unmapped, ambiguous = mapper.map_statement(
+        _statement(["Revenue", "Sales & Services Revenue"]), "income"
+    )
+
+    assert mapped.index.tolist() == ["Total Revenue", "Sales & Services Revenue"]
+    assert mapped.loc["Total Revenue"].tolist() == [1.0, 1.0, 1.0]
+    assert ambiguous == ["Sales & Services Revenue"]
+    assert unmapped == []
+
+
+def test_map_statement_whitespace_and_case(mapper):
+    """Labels are stripped and matched case-insensitively."""
+    mapped, unmapped, _ = mapper.map_statement(
+        _statement(["  REVENUE ", "cost of goods sold", " Mystery Adjustment  "]), "income"
+    )
+
+    assert mapped.index.tolist() == ["Total Revenue", "Cost Of Revenue", "Mystery Adjustment"]
+    assert unmapped == ["Mystery Adjustment"]
+
+
+def test_map_statement_missing_label(mapper):
+    """A missing label is kept as 'nan' text and reported as unmapped."""
+    mapped, unmapped, _ = mapper.map_statement(_statement(["Revenue", float("nan")]), "income")
+
+    assert mapped.index.tolist() == ["Total Revenue", "nan"]
+    assert mapped.index.dtype == object
+    assert unmapped == ["nan"]
+
+
+def test_map_statement_sorts_columns(mapper):
+    """Periods come out oldest to newest, with values moved along."""
+    df = _statement(["Revenue"], periods=["FY2024", "FY2022", "FY2023"])
+    df.loc["Revenue"] = [24.0, 22.0, 23.0]
+
+    mapped, _, _ = mapper.map_statement(df, "income")
+
+    assert mapped.columns.tolist() == PERIODS
+    assert mapped.loc["Total Revenue"].tolist() == [22.0, 23.0, 24.0]
+
+
+def test_map_statement_invalid_type(mapper):
+    with pytest.raises(ValueError):
+        mapper.map_statement(_statement(["Revenue"]), "equity")
+
+
+def test_merge_empty_primary():
+    """With no primary data, the fallback is used and every field reported."""
+    fallback = _statement(["Total Revenue", "Net Income"])
+
+    merged, fallback_fields = merge_bloomberg_yfinance(pd.DataFrame(), fallback)
+
+    assert merged is fallback
+    assert fallback_fields == ["Total Revenue", "Net Income"]
+
+
+def test_merge_empty_fallback():
+    """With no fallback data, the primary is returned unchanged."""
+    primary = _statement(["Total Revenue", "Net Income"])
+
+    merged, fallback_fields = merge_bloomberg_yfinance(primary, pd.DataFrame())
+
+    assert merged is primary
+    assert fallback_fields == []
+
+
+def test_merge_aligns_fallback_columns():
+    """Fallback-only rows are appended on the primary's columns."""
+    primary = _statement(["Total Revenue", "Net Income"])
+    fallback = _statement(["Net Income", "Total Assets"], periods=["FY2023", "FY2024", "FY2025"])
+
+    merged, fallback_fields = merge_bloomberg_yfinance(primary, fallback, primary="bloomberg")
+
+    assert fallback_fields == ["Total Assets"]
+    assert merged.index.tolist() == ["Total Revenue", "Net Income", "Total Assets"]
+    assert merged.columns.tolist() == PERIODS
+    # Primary values win for the shared field
+    assert merged.loc["Net Income"].tolist() == [2.0, 2.0, 2.0]
+    # FY2022 has no fallback value, FY2025 is dropped
+    assert merged.loc["Total Assets"].isna().tolist() == [True, False, False]
+    assert merged.loc["Total Assets", "FY2024"] == 2.0
+
+
+def test_merge_yfinance_primary():
+    """primary='yfinance' swaps which source fills the gaps."""
+    bloomberg = _statement(["Total Revenue", "EBITDA"])
+    yfinance = _statement(["Total Revenue"])
+
+    merged, fallback_fields = merge_bloomberg_yfinance(bloomberg, yfinance, primary="yfinance")
+
+    assert fallback_fields == ["EBITDA"]
+    assert merged.index.tolist() == ["Total Revenue", "EBITDA"]
@@ -0,0 +1,130 @@
+"""
+Test the Excel sheet payload builder with synthetic frames (no network).
+"""
+
+import io
+import re
+import threading
+import zipfile
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from agents.state import create_initial_state
+from generators import excel_generator
+from generators.excel_generator import (
+    _build_dividends_payload,
+    _build_payloads,
+    _build_ratios_payload,
+    _dataframe_payload,
+    _payload,
+    _save_with_openpyxl,
+    _save_with_xlsxwriter,
+)
+
+
+@pytest.fixture
+def dividends():
+    """Dividend history shaped like fetch_dividends() output (tz-aware dates)."""
+    dates = pd.date_range("2023-08-18", periods=3, freq="180D", tz="Asia/Kolkata")
+    return pd.DataFrame({"Date": dates, "Dividend": [9.0, 10.0, 10.5]})
+
+
+@pytest.fixture
+def research_state(dividends):
+    """Minimal analysed state with a dividends sheet to build."""
+    state = create_initial_state("RELIANCE", "Reliance Industries Limited")
+    state.update(financial_statements={}, valuation_recommendation="Buy", dividends=dividends)
+    return state
+
+
+def _data_rows(payload):
+    """Payload rows below the title, blank and header rows."""
+    return payload["rows"][3:]
+
+
+def test_tz_aware_dates_are_written_naive(dividends):
+    """tz-aware Date cells become naive local timestamps."""
+    payload = _dataframe_payload("Dividends", dividends, title="DIVIDEND HISTORY")
+
+    dates = [row[1] for row in _data_rows(payload)]
+    assert all(isinstance(value, datetime) and value.tzinfo is None for value in dates)
+    assert dates[0] == datetime(2023, 8, 18)
+
+
+def test_date_columns_get_date_format(dividends):
+    """Datetime columns are tagged with the date number format."""
+    payload = _dataframe_payload("Dividends", dividends, title="DIVIDEND HISTORY")
+
+    assert payload["column_formats"] == {"A": "int", "B": "date", "C": "num"}
+
+
+def test_tz_aware_dates_save_with_openpyxl(dividends):
+    """The openpyxl engine accepts a payload built from tz-aware dates."""
+    buffer = io.BytesIO()
+    _save_with_openpyxl([_dataframe_payload("Dividends", dividends, title="DIVIDEND HISTORY")], buffer)
+    assert buffer.getbuffer().nbytes > 0
+
+
+def test_tz_aware_dates_save_with_xlsxwriter(dividends):
+    """The XlsxWriter engine accepts a payload built from tz-aware dates."""
+    pytest.importorskip("xlsxwriter")
+    buffer = io.BytesIO()
+    _save_with_xlsxwriter([_dataframe_payload("Dividends", dividends, title="DIVIDEND HISTORY")], buffer)
+    assert buffer.getbuffer().nbytes > 0
+
+
+def test_dividends_sheet(dividends):
+    """The Dividends sheet writes naive dates and per-share amounts as-is."""
+    payload = _build_dividends_payload({"dividends": dividends}, {})
+
+    assert _data_rows(payload) == [
+        (0, datetime(2023, 8, 18), 9.0),
+        (1, datetime(2024, 2, 14), 10.0),
+        (2, datetime(2024, 8, 12), 10.5),
+    ]
+    assert payload["column_formats"]["B"] == "date"
+
+
+def test_payloads_built_in_process_pool(research_state, monkeypatch):
+    """The pool path yields the same payloads as the serial one."""
+    serial = _build_payloads(research_state)
+
+    monkeypatch.setattr(excel_generator, "_PARALLEL_ROW_THRESHOLD", 1)
+    assert _build_payloads(research_state) == serial
+
+
+def test_unpicklable_state_falls_back_to_serial(research_state, monkeypatch):
+    """State the pool cannot pickle is built serially instead of raising."""
+    serial = _build_payloads(research_state)
+
+    research_state["lock"] = threading.Lock()
+    monkeypatch.setattr(excel_generator, "_PARALLEL_ROW_THRESHOLD", 1)
+    assert _build_payloads(research_state) == serial
+
+
+def test_openpyxl_modified_stamp_is_utc():
+    """dcterms:modified carries a 'Z' suffix, so it must be UTC time."""
+    buffer = io.BytesIO()
+    _save_with_openpyxl([_payload("Sheet", [["value"]])], buffer)
+
+    core = zipfile.ZipFile(buffer).read("docProps/core.xml").decode()
+    stamp = re.search(r"<dcterms:modified[^>]*>([^<]+)</dcterms:modified>", core).group(1)
+    modified = datetime.strptime(stamp, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    assert abs(datetime.now(timezone.utc) - modified) < timedelta(minutes=1)
+
+
+def test_ratios_grid_formats_infinite_values():
+    """Infinite ratios print as 'inf' (not float max) and missing ones as N/A."""
+    state = {'ratios_by_year': [{
+        'date': '2024-03-31',
+        'ratios': {'current_ratio': 1.234, 'interest_coverage': float('inf'),
+                   'net_profit_margin': float('-inf'), 'pe_ratio': None},
+    }]}
+    rows = {row[0]: row[1] for row in _build_ratios_payload(state, {})['rows'] if len(row) == 2}
+
+    assert rows['Current Ratio'] == ('right', '1.23')
+    assert rows['Interest Coverage'] == ('right', 'inf')
+    assert rows['Net Profit Margin'] == ('right', '-inf%')
+    assert rows['Pe Ratio'] == ('center', 'N/A')
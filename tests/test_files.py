@@ -0,0 +1,49 @@
+"""
+Test the atomic file writer shared by the document generators.
+"""
+
+import io
+import os
+
+import pytest
+
+from utils.files import write_atomically
+
+
+def test_new_file_gets_umask_mode(tmp_path):
+    """A new file gets 0o666 minus the umask, not the temp file's 0o600."""
+    umask = os.umask(0)
+    os.umask(umask)
+    target = tmp_path / "report.xlsx"
+
+    write_atomically(io.BytesIO(b"workbook"), target)
+
+    assert target.read_bytes() == b"workbook"
+    assert target.stat().st_mode & 0o777 == 0o666 & ~umask
+
+
+def test_existing_file_keeps_its_mode(tmp_path):
+    target = tmp_path / "report.docx"
+    target.write_bytes(b"old")
+    os.chmod(target, 0o640)
+
+    write_atomically(io.BytesIO(b"new"), target)
+
+    assert target.read_bytes() == b"new"
+    assert target.stat().st_mode & 0o777 == 0o640
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path):
+    """A write error removes the temp file and leaves the target untouched."""
+    class FailingBuffer(io.BytesIO):
+        def getbuffer(self):
+            raise OSError(28, "No space left on device")
+
+    target = tmp_path / "report.xlsx"
+    target.write_bytes(b"old")
+
+    with pytest.raises(OSError):
+        write_atomically(FailingBuffer(), target)
+
+    assert os.listdir(tmp_path) == ["report.xlsx"]
+    assert target.read_bytes() == b"old"
@@ -0,0 +1,16 @@
+"""
+Test that settings-derived caches follow environment changes.
+"""
+
+from config.settings import get_ticker_with_suffix
+
+
+def test_ticker_suffix_follows_env(monkeypatch):
+    """A changed NSE_SUFFIX is used without any other settings call."""
+    assert get_ticker_with_suffix("RELIANCE") == "RELIANCE.NS"
+
+    monkeypatch.setenv("NSE_SUFFIX", ".NX")
+    assert get_ticker_with_suffix("RELIANCE") == "RELIANCE.NX"
+
+    monkeypatch.delenv("NSE_SUFFIX")
+    assert get_ticker_with_suffix("RELIANCE") == "RELIANCE.NS"
@@ -2,128 +2,86 @@
 Test UI components and functionality.
 """
 
-import sys
+import ast
+import os
+from importlib.util import find_spec
 from pathlib import Path
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Names ui/app.py imports from each project module
+UI_IMPORTS = {
+    "agents": ("create_research_graph", "create_initial_state"),
+    "generators": ("generate_word_report", "generate_excel_workbook"),
+    "utils.logger": ("logger",),
+}
+
+
+def _top_level_names(path):
+    """
+    Names a module defines or exports, read from its source without running it.
+
+    Covers top-level imports, assignments, functions and classes, plus the
+    entries of ``__all__`` (lazily resolved names are only listed there).
+    """
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    names = set()
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            names.update((alias.asname or alias.name).split(".")[0] for alias in node.names)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    names.add(target.id)
+                    if target.id == "__all__":
+                        names.update(ast.literal_eval(node.value))
+    return names
 
 
 def test_ui_imports():
-    """Test that UI imports work correctly."""
-    try:
-        # Test main imports
-        from agents import create_research_graph, create_initial_state
-        from generators import generate_word_report, generate_excel_workbook
-        from utils.logger import logger
-        
-        print("✅ All UI imports successful!")
-        return True
-    except Exception as e:
-        print(f"❌ UI import error: {e}")
-        return False
+    """Test that the modules and names the UI imports can be found."""
+    for module, names in UI_IMPORTS.items():
+        # find_spec locates the module without executing it (or its
+        # LangGraph / python-docx / loguru dependencies)
+        spec = find_spec(module)
+        assert spec is not None, f"{module} not importable"
+        missing = set(names) - _top_level_names(spec.origin)
+        assert not missing, f"{module} does not provide {sorted(missing)}"
 
 
 def test_ui_file_exists():
     """Test that UI files exist."""
-    ui_dir = Path(__file__).parent.parent / "ui"
+    root = Path(__file__).parent.parent
+    
+    # One directory read per folder instead of a stat() per file
+    ui_names = {entry.name for entry in os.scandir(root / "ui")}
+    root_names = {entry.name for entry in os.scandir(root)}
     
     required_files = [
-        ui_dir / "app.py",
-        ui_dir / "README.md",
-        ui_dir / "__init__.py",
-        Path(__file__).parent.parent / "run_ui.py"
+        ("ui/app.py", "app.py", ui_names),
+        ("ui/README.md", "README.md", ui_names),
+        ("ui/__init__.py", "__init__.py", ui_names),
+        ("run_ui.py", "run_ui.py", root_names),
     ]
     
-    all_exist = True
-    for file_path in required_files:
-        if file_path.exists():
-            print(f"✅ {file_path.name} exists")
-        else:
-            print(f"❌ {file_path.name} missing")
-            all_exist = False
-    
-    return all_exist
+    missing = [path for path, name, names in required_files if name not in names]
+    assert not missing, f"Missing UI files: {missing}"
 
 
-def test_state_creation():
+def test_state_creation(initial_state):
     """Test state creation for UI workflow."""
-    try:
-        from agents import create_initial_state
-        
-        state = create_initial_state("RELIANCE", "Reliance Industries Limited")
-        
-        # Ticker normalization happens in data collection node, not in initial state
-        assert state['ticker'] == "RELIANCE", "Ticker should be as provided"
-        assert state['company_name'] == "Reliance Industries Limited"
-        assert state['current_step'] == 'start', "Initial step should be 'start'"
-        assert state['errors'] == []
-        assert state['warnings'] == []
-        assert state['data_complete'] == False
-        
-        print("✅ State creation successful!")
-        return True
-    except AssertionError as e:
-        print(f"❌ State creation assertion error: {e}")
-        return False
-    except Exception as e:
-        print(f"❌ State creation error: {e}")
-        return False
+    from agents import create_initial_state
+    
+    assert initial_state['ticker'] == "RELIANCE", "Ticker should be as provided"
+    assert create_initial_state(" reliance ")['ticker'] == "RELIANCE", "Ticker should be normalized"
+    assert initial_state['company_name'] == "Reliance Industries Limited"
+    assert initial_state['current_step'] == 'start', "Initial step should be 'start'"
+    assert initial_state['errors'] == []
+    assert initial_state['warnings'] == []
+    assert initial_state['data_complete'] == False
 
 
-def test_graph_creation():
+def test_graph_creation(research_graph):
     """Test graph creation for UI workflow."""
-    try:
-        from agents import create_research_graph
-        
-        app = create_research_graph()
-        
-        # Check that app has required methods
-        assert hasattr(app, 'invoke'), "Graph should have invoke method"
-        
-        print("✅ Graph creation successful!")
-        return True
-    except Exception as e:
-        print(f"❌ Graph creation error: {e}")
-        return False
-
-
-if __name__ == "__main__":
-    print("="*70)
-    print("TESTING UI COMPONENTS")
-    print("="*70)
-    
-    tests = [
-        ("UI Imports", test_ui_imports),
-        ("UI Files", test_ui_file_exists),
-        ("State Creation", test_state_creation),
-        ("Graph Creation", test_graph_creation)
-    ]
-    
-    results = []
-    for test_name, test_func in tests:
-        print(f"\n🧪 Testing: {test_name}")
-        print("-" * 70)
-        result = test_func()
-        results.append((test_name, result))
-    
-    print("\n" + "="*70)
-    print("TEST SUMMARY")
-    print("="*70)
-    
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
-    
-    for test_name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
-        print(f"{status}: {test_name}")
-    
-    print(f"\n📊 Results: {passed}/{total} tests passed")
-    
-    if passed == total:
-        print("🎉 All UI tests passed!")
-        sys.exit(0)
-    else:
-        print("⚠️ Some tests failed")
-        sys.exit(1)
-
+    # Check that app has required methods
+    assert hasattr(research_graph, 'invoke'), "Graph should have invoke method"
@@ -1,222 +1,103 @@
 """
-Test script to validate yfinance data acquisition for Indian companies.
+Tests to validate yfinance data acquisition for Indian companies.
 
-This script tests:
+These tests check:
 1. Stock price data availability
 2. Financial statements (Income, Balance Sheet, Cash Flow)
 3. Company information
 4. Dividend history
 5. NIFTY 50 benchmark data
+
+The per-company tests run once for each company in conftest.TEST_COMPANIES
+and share one ``stock`` Ticker per company. The network-bound cases can
+run in parallel with pytest-xdist:
+
+    pytest -n auto --run-network tests/test_yfinance_data.py
+
+Data that Yahoo only provides for some companies (statements, dividends)
+is reported as a warning rather than a failure. Every test here calls Yahoo,
+so the module is skipped unless --run-network is given.
+
+Each company test records what it found with ``record_property``, so
+``--junitxml`` output carries a ticker-by-dataset matrix for CI dashboards.
 """
 
-import yfinance as yf
-import pandas as pd
-from datetime import datetime, timedelta
-import sys
-from pathlib import Path
+import warnings
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
-from config.settings import DEFAULT_MARKET_INDEX, get_ticker_with_suffix
-from utils.logger import logger
+# yfinance, NumPy and pandas are imported inside the fixtures and tests that
+# use them, so collecting these tests does not pay for them
 
+pytestmark = pytest.mark.network
 
-def test_company_data(ticker: str, exchange: str = "NSE"):
-    """
-    Test data acquisition for a single company.
-    
-    Args:
-        ticker: Base ticker symbol (e.g., "RELIANCE")
-        exchange: Exchange name ("NSE" or "BSE")
-    """
-    logger.info(f"\n{'='*60}")
-    logger.info(f"Testing {ticker} on {exchange}")
-    logger.info(f"{'='*60}")
-    
-    # Get ticker with suffix
-    full_ticker = get_ticker_with_suffix(ticker, exchange)
-    logger.info(f"Full ticker: {full_ticker}")
-    
-    try:
-        # Create ticker object
-        stock = yf.Ticker(full_ticker)
-        
-        # Test 1: Company Info
-        logger.info("\n📋 Test 1: Company Information")
-        info = stock.info
-        if info:
-            logger.success(f"✅ Company Name: {info.get('longName', 'N/A')}")
-            logger.success(f"✅ Sector: {info.get('sector', 'N/A')}")
-            logger.success(f"✅ Industry: {info.get('industry', 'N/A')}")
-            logger.success(f"✅ Market Cap: ₹{info.get('marketCap', 0):,.0f}")
-            logger.success(f"✅ PE Ratio: {info.get('trailingPE', 'N/A')}")
-        else:
-            logger.error("❌ No company info available")
-            return False
-        
-        # Test 2: Historical Prices
-        logger.info("\n📈 Test 2: Historical Stock Prices (5 years)")
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=5*365)
-        hist = stock.history(start=start_date, end=end_date)
-        
-        if not hist.empty:
-            logger.success(f"✅ Retrieved {len(hist)} days of price data")
-            logger.success(f"✅ Date Range: {hist.index[0].date()} to {hist.index[-1].date()}")
-            logger.success(f"✅ Latest Close: ₹{hist['Close'].iloc[-1]:.2f}")
-            logger.success(f"✅ 52-Week High: ₹{hist['High'].tail(252).max():.2f}")
-            logger.success(f"✅ 52-Week Low: ₹{hist['Low'].tail(252).min():.2f}")
-        else:
-            logger.error("❌ No historical price data available")
-            return False
-        
-        # Test 3: Financial Statements
-        logger.info("\n💰 Test 3: Financial Statements")
-        
-        # Income Statement
-        income_stmt = stock.financials
-        if not income_stmt.empty:
-            logger.success(f"✅ Income Statement: {len(income_stmt.columns)} periods")
-            logger.success(f"   Available metrics: {len(income_stmt)} line items")
-            if 'Total Revenue' in income_stmt.index:
-                revenue = income_stmt.loc['Total Revenue'].iloc[0]
-                logger.success(f"   Latest Revenue: ₹{revenue:,.0f}")
-        else:
-            logger.warning("⚠️ Income statement data limited/unavailable")
-        
-        # Balance Sheet
-        balance_sheet = stock.balance_sheet
-        if not balance_sheet.empty:
-            logger.success(f"✅ Balance Sheet: {len(balance_sheet.columns)} periods")
-            logger.success(f"   Available metrics: {len(balance_sheet)} line items")
-        else:
-            logger.warning("⚠️ Balance sheet data limited/unavailable")
-        
-        # Cash Flow
-        cash_flow = stock.cashflow
-        if not cash_flow.empty:
-            logger.success(f"✅ Cash Flow: {len(cash_flow.columns)} periods")
-            logger.success(f"   Available metrics: {len(cash_flow)} line items")
-        else:
-            logger.warning("⚠️ Cash flow data limited/unavailable")
-        
-        # Test 4: Dividends
-        logger.info("\n💵 Test 4: Dividend History")
-        dividends = stock.dividends
-        if not dividends.empty:
-            logger.success(f"✅ Dividend History: {len(dividends)} payments")
-            recent_divs = dividends.tail(5)
-            logger.success(f"✅ Recent dividends (last 5):")
-            for date, amount in recent_divs.items():
-                logger.success(f"   {date.date()}: ₹{amount:.2f}")
-        else:
-            logger.info("ℹ️ No dividend history (company may not pay dividends)")
-        
-        # Test 5: Quarterly Data
-        logger.info("\n📊 Test 5: Quarterly Financials")
-        quarterly_income = stock.quarterly_financials
-        if not quarterly_income.empty:
-            logger.success(f"✅ Quarterly Income: {len(quarterly_income.columns)} quarters")
-        else:
-            logger.warning("⚠️ Quarterly financial data limited/unavailable")
-        
-        logger.success(f"\n✅ {ticker} ({exchange}) - Data acquisition successful!\n")
-        return True
-        
-    except Exception as e:
-        logger.error(f"\n❌ Error testing {ticker}: {str(e)}\n")
-        return False
-
-
-def test_market_index():
-    """Test NIFTY 50 index data acquisition."""
-    logger.info(f"\n{'='*60}")
-    logger.info(f"Testing Market Benchmark: {DEFAULT_MARKET_INDEX} (NIFTY 50)")
-    logger.info(f"{'='*60}")
-    
-    try:
-        nifty = yf.Ticker(DEFAULT_MARKET_INDEX)
-        
-        # Get 5 years of index data
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=5*365)
-        hist = nifty.history(start=start_date, end=end_date)
-        
-        if not hist.empty:
-            logger.success(f"✅ Retrieved {len(hist)} days of NIFTY 50 data")
-            logger.success(f"✅ Date Range: {hist.index[0].date()} to {hist.index[-1].date()}")
-            logger.success(f"✅ Current Level: {hist['Close'].iloc[-1]:.2f}")
-            
-            # Calculate returns
-            returns = hist['Close'].pct_change().dropna()
-            annual_return = (1 + returns.mean())**252 - 1
-            logger.success(f"✅ Annualized Return: {annual_return:.2%}")
-            logger.success(f"✅ Volatility (StdDev): {returns.std() * (252**0.5):.2%}")
-            
-            return True
-        else:
-            logger.error("❌ No NIFTY 50 data available")
-            return False
-            
-    except Exception as e:
-        logger.error(f"❌ Error testing NIFTY 50: {str(e)}")
-        return False
-
-
-def main():
-    """Run all data acquisition tests."""
-    logger.info("=" * 80)
-    logger.info("YFINANCE DATA ACQUISITION TEST - INDIAN MARKETS")
-    logger.info("=" * 80)
-    
-    # Test companies (diverse sectors)
-    test_companies = [
-        ("RELIANCE", "NSE"),   # Oil & Gas / Telecom / Retail
-        ("TCS", "NSE"),        # IT Services
-        ("INFY", "NSE"),       # IT Services
-        ("HDFCBANK", "NSE"),   # Banking
-        ("ITC", "NSE"),        # FMCG / Tobacco
-    ]
-    
-    results = {}
-    
-    # Test market index first
-    logger.info("\n🏛️ Testing Market Benchmark...")
-    results['NIFTY50'] = test_market_index()
-    
-    # Test individual companies
-    logger.info("\n🏢 Testing Individual Companies...")
-    for ticker, exchange in test_companies:
-        results[ticker] = test_company_data(ticker, exchange)
-    
-    # Summary
-    logger.info("\n" + "=" * 80)
-    logger.info("TEST SUMMARY")
-    logger.info("=" * 80)
-    
-    passed = sum(1 for v in results.values() if v)
-    total = len(results)
-    
-    for name, result in results.items():
-        status = "✅ PASS" if result else "❌ FAIL"
-        logger.info(f"{status} - {name}")
+
+def test_info(stock):
+    """Test company information for one company."""
+    info = stock.info
+    assert info, "No company info available"
+    assert info.get('longName') or info.get('shortName'), "Company name missing"
+
+
+def test_history(stock, price_histories, record_property):
+    """Test 5 years of historical prices for one company."""
+    import numpy as np
     
-    logger.info(f"\n📊 Results: {passed}/{total} tests passed ({passed/total*100:.1f}%)")
+    hist = price_histories[stock.ticker]
+    record_property("price_days", len(hist))
+    assert not hist.empty, "No historical price data available"
     
-    if passed == total:
-        logger.success("\n🎉 All data acquisition tests passed!")
-        logger.info("\n💡 Next Steps:")
-        logger.info("   1. Create data collection tools (tools/data_tools.py)")
-        logger.info("   2. Implement financial ratio calculations")
-        logger.info("   3. Build the three agents (Data, Analysis, Research)")
-    else:
-        logger.warning(f"\n⚠️ {total - passed} test(s) failed. Review data sources.")
+    high_52w = np.nanmax(hist['High'].to_numpy()[-252:])
+    low_52w = np.nanmin(hist['Low'].to_numpy()[-252:])
+    assert hist['Close'].iat[-1] > 0 and high_52w >= low_52w > 0, "Implausible price data"
+
+
+def test_financials(stock, record_property):
+    """Test annual financial statements for one company."""
+    statements = (
+        ("Income statement", stock.financials),
+        ("Balance sheet", stock.balance_sheet),
+        ("Cash flow", stock.cashflow),
+    )
+    for name, statement in statements:
+        rows, periods = statement.shape
+        record_property(f"{name.lower().replace(' ', '_')}_periods", periods)
+        if not (rows and periods):
+            warnings.warn(f"{name} data limited/unavailable for {stock.ticker}")
+
+
+def test_dividends(stock, record_property):
+    """Test dividend history for one company."""
+    dividends = stock.dividends
+    record_property("dividend_payments", len(dividends))
     
-    return passed == total
+    # Companies that pay no dividends have an empty history
+    assert dividends.empty or (dividends.to_numpy() > 0).all(), "Non-positive dividend"
+
 
+def test_quarterly(stock, record_property):
+    """Test quarterly financials for one company."""
+    rows, quarters = stock.quarterly_financials.shape
+    record_property("quarters", quarters)
+    if not (rows and quarters):
+        warnings.warn(f"Quarterly financial data limited/unavailable for {stock.ticker}")
 
-if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
 
+def test_market_index(nifty_history):
+    """
+    Test NIFTY 50 index data acquisition.
+    
+    Args:
+        nifty_history: Pre-fetched NIFTY 50 price history
+    """
+    import numpy as np
+    
+    hist = nifty_history
+    assert not hist.empty, "No NIFTY 50 data available"
+    
+    # Daily returns on the raw close array
+    close = hist['Close'].dropna().to_numpy()
+    returns = np.diff(close) / close[:-1]
+    annual_return = (1 + returns.mean())**252 - 1
+    volatility = returns.std(ddof=1) * (252**0.5)
+    assert np.isfinite(annual_return) and volatility > 0, "Implausible NIFTY 50 returns"
@@ -13,16 +13,23 @@ The mapping ensures that:
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from typing import Dict, List, Tuple, Optional, Literal
+from typing import ClassVar, Dict, List, Tuple, Optional, Literal
 import pandas as pd
 from utils.logger import logger
 
+try:
+    import pyarrow  # noqa: F401
+    _ARROW_STRING = 'string[pyarrow]'
+except ImportError:  # Optional; labels are cleaned as Python str objects otherwise
+    _ARROW_STRING = None
+
 
 # ==================== FIELD MAPPINGS ====================
 
@@ -220,21 +227,76 @@ CASHFLOW_MAP = {
     'Ending Cash': 'End Cash Position',
 }
 
+def _normalize_map(field_map: Dict[str, str]) -> Dict[str, str]:
+    """
+    Key a field map by stripped, casefolded Bloomberg name.
+    
+    Keys and values are interned, so every mapped index label that names
+    the same yfinance field (e.g. 'Total Revenue') is one shared string.
+    """
+    return {sys.intern(k.strip().casefold()): sys.intern(v) for k, v in field_map.items()}
+
+
+# Lookup tables built once at import, so field matching ignores case and
+# stray whitespace
+_INCOME_NORM = _normalize_map(INCOME_STATEMENT_MAP)
+_BALANCE_NORM = _normalize_map(BALANCE_SHEET_MAP)
+_CASHFLOW_NORM = _normalize_map(CASHFLOW_MAP)
+
+
+def _clean_labels(index: pd.Index) -> pd.Index:
+    """
+    Convert index labels to strings and strip surrounding whitespace.
+    
+    With pyarrow installed the strip runs in Arrow's string kernels. Indexes
+    with missing labels are converted with ``map(str)``, which renders them
+    as 'nan'/'None' text the way the mapper always has (on pandas 3,
+    ``astype(str)`` would leave them missing). The result dtype depends on
+    the path taken; callers cast the final index back to ``object``.
+    """
+    if _ARROW_STRING is not None and not index.hasnans:
+        return index.astype(_ARROW_STRING).str.strip()
+    return index.map(str).str.strip()
+
+
 # ==================== MAPPER CLASS ====================
 
 class BloombergFieldMapper:
-    """Maps Bloomberg field names to yfinance-compatible field names."""
+    """
+    Maps Bloomberg field names to yfinance-compatible field names.
     
-    def __init__(self):
-        """Initialize the mapper with field mapping dictionaries."""
-        self.income_map = INCOME_STATEMENT_MAP
-        self.balance_map = BALANCE_SHEET_MAP
-        self.cashflow_map = CASHFLOW_MAP
-        
+    The mapper is stateless: the normalized field maps are class-level
+    constants and instances carry no attributes of their own.
+    """
+    
+    __slots__ = ()
+    
+    income_map: ClassVar[Dict[str, str]] = _INCOME_NORM
+    balance_map: ClassVar[Dict[str, str]] = _BALANCE_NORM
+    cashflow_map: ClassVar[Dict[str, str]] = _CASHFLOW_NORM
+    
+    # Fields that must be present after mapping, per statement type
+    _CRITICAL_FIELDS: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        'income': (
+            'Total Revenue', 'Cost Of Revenue', 'Gross Profit',
+            'Operating Income', 'Pretax Income', 'Net Income'
+        ),
+        'balance': (
+            'Total Assets', 'Current Assets', 'Current Liabilities',
+            'Total Liabilities Net Minority Interest', 'Stockholders Equity'
+        ),
+        'cashflow': (
+            'Operating Cash Flow', 'Investing Cash Flow', 'Financing Cash Flow'
+        ),
+    }
+    
+    @classmethod
+    def describe(cls):
+        """Log how many field mappings each statement type has."""
         logger.info("BloombergFieldMapper initialized")
-        logger.info(f"  Income Statement: {len(self.income_map)} field mappings")
-        logger.info(f"  Balance Sheet: {len(self.balance_map)} field mappings")
-        logger.info(f"  Cash Flow: {len(self.cashflow_map)} field mappings")
+        logger.info(f"  Income Statement: {len(cls.income_map)} field mappings")
+        logger.info(f"  Balance Sheet: {len(cls.balance_map)} field mappings")
+        logger.info(f"  Cash Flow: {len(cls.cashflow_map)} field mappings")
     
     def map_statement(
         self,
@@ -272,44 +334,38 @@ class BloombergFieldMapper:
         else:
             raise ValueError(f"Invalid statement_type: {statement_type}")
         
-        # Perform mapping - build new index
-        new_index = []
-        unmapped_fields = []
-        ambiguous_fields = []
-        mapped_count = 0
+        # Clean field names (remove leading/trailing whitespace) and look
+        # them all up, case-insensitively, in one vectorised pass
+        clean_fields = _clean_labels(bloomberg_df.index)
+        targets = clean_fields.str.casefold().map(field_map)
+        has_mapping = targets.notna()
         
-        for bloomberg_field in bloomberg_df.index:
-            # Clean field name (remove leading/trailing whitespace)
-            clean_field = str(bloomberg_field).strip()
-            
-            # Check if field has direct mapping
-            if clean_field in field_map:
-                yfinance_field = field_map[clean_field]
-                
-                # Check for ambiguous mapping (multiple Bloomberg → same yfinance)
-                if yfinance_field in new_index:
-                    ambiguous_fields.append(clean_field)
-                    logger.debug(f"  Ambiguous: '{clean_field}' → '{yfinance_field}' (already exists)")
-                    # Keep original name to avoid duplicates
-                    new_index.append(clean_field)
-                else:
-                    # Map the field
-                    new_index.append(yfinance_field)
-                    mapped_count += 1
-                    logger.debug(f"  Mapped: '{clean_field}' → '{yfinance_field}'")
-            
-            else:
-                # No mapping found - preserve original field name
-                unmapped_fields.append(clean_field)
-                new_index.append(clean_field)
-                logger.debug(f"  Unmapped (preserved): '{clean_field}'")
+        # Unmapped fields keep their (cleaned) original name
+        new_index = targets.where(has_mapping, clean_fields)
         
-        # Create mapped DataFrame by copying original and replacing index
-        mapped_df = bloomberg_df.copy()
-        mapped_df.index = new_index
+        # Ambiguous mapping (multiple Bloomberg → same yfinance): only the first
+        # keeps the yfinance name, later ones keep their original name
+        ambiguous = has_mapping & new_index.duplicated(keep='first')
+        new_index = new_index.where(~ambiguous, clean_fields)
         
-        # Sort columns chronologically (oldest to newest)
-        if len(mapped_df.columns) > 0:
+        unmapped_fields = clean_fields[~has_mapping].tolist()
+        ambiguous_fields = clean_fields[ambiguous].tolist()
+        mapped_count = int(has_mapping.sum() - ambiguous.sum())
+        
+        # Per-field detail is only formatted when a DEBUG sink is active
+        logger.opt(lazy=True).debug(
+            "  Field mapping:\n{}",
+            lambda: "\n".join(f"    '{src}' → '{dst}'" for src, dst in zip(clean_fields, new_index)),
+        )
+        
+        # Relabel a shallow copy: the new frame shares the caller's value
+        # blocks, so only the index is new
+        mapped_df = bloomberg_df.copy(deep=False)
+        mapped_df.index = new_index.astype(object)
+        
+        # Sort columns chronologically (oldest to newest), unless the export
+        # already has them in order
+        if len(mapped_df.columns) > 1 and not mapped_df.columns.is_monotonic_increasing:
             mapped_df = mapped_df.sort_index(axis=1)
         
         logger.success(f"✅ Mapped {statement_type} statement:")
@@ -344,24 +400,12 @@ class BloombergFieldMapper:
             >>> if not is_valid:
             ...     logger.warning(f"Missing critical fields: {missing}")
         """
-        # Define critical fields for each statement type
-        critical_fields = {
-            'income': [
-                'Total Revenue', 'Cost Of Revenue', 'Gross Profit',
-                'Operating Income', 'Pretax Income', 'Net Income'
-            ],
-            'balance': [
-                'Total Assets', 'Current Assets', 'Current Liabilities',
-                'Total Liabilities Net Minority Interest', 'Stockholders Equity'
-            ],
-            'cashflow': [
-                'Operating Cash Flow', 'Investing Cash Flow', 'Financing Cash Flow'
-            ]
-        }
+        required = self._CRITICAL_FIELDS.get(statement_type, ())
         
-        required = critical_fields.get(statement_type, [])
-        present = [field for field in required if field in mapped_df.index]
-        missing = [field for field in required if field not in mapped_df.index]
+        # One hash set of the index instead of an Index lookup per field
+        fields = set(mapped_df.index)
+        present = [field for field in required if field in fields]
+        missing = [field for field in required if field not in fields]
         
         is_valid = len(missing) == 0
         
@@ -373,6 +417,18 @@ class BloombergFieldMapper:
         return is_valid, missing, present
 
 
+@lru_cache(maxsize=1)
+def get_mapper() -> BloombergFieldMapper:
+    """
+    Return the shared BloombergFieldMapper.
+    
+    The mapper holds only the module-level lookup tables, so one instance
+    serves every call. Its mapping counts are logged on first use.
+    """
+    BloombergFieldMapper.describe()
+    return BloombergFieldMapper()
+
+
 def merge_bloomberg_yfinance(
     bloomberg_df: pd.DataFrame,
     yfinance_df: pd.DataFrame,
@@ -391,7 +447,8 @@ def merge_bloomberg_yfinance(
     
     Returns:
         Tuple of (merged_df, fallback_fields)
-        - merged_df: Merged DataFrame
+        - merged_df: Merged DataFrame (the non-empty input itself, uncopied,
+          when the other source is missing or empty)
         - fallback_fields: List of fields that used fallback source
     
     Example:
@@ -401,29 +458,33 @@ def merge_bloomberg_yfinance(
     """
     logger.info(f"Merging Bloomberg and yfinance data (primary: {primary})...")
     
-    fallback_fields = []
-    
     if primary == 'bloomberg':
-        # Start with Bloomberg data
-        merged_df = bloomberg_df.copy()
-        
-        # Add missing fields from yfinance
-        for field in yfinance_df.index:
-            if field not in merged_df.index:
-                merged_df.loc[field] = yfinance_df.loc[field]
-                fallback_fields.append(field)
-                logger.debug(f"  Added from yfinance: {field}")
-    
+        # Start with Bloomberg data, add missing fields from yfinance
+        primary_df, fallback_df = bloomberg_df, yfinance_df
     else:  # primary == 'yfinance'
-        # Start with yfinance data
-        merged_df = yfinance_df.copy()
-        
-        # Add missing fields from Bloomberg
-        for field in bloomberg_df.index:
-            if field not in merged_df.index:
-                merged_df.loc[field] = bloomberg_df.loc[field]
-                fallback_fields.append(field)
-                logger.debug(f"  Added from Bloomberg: {field}")
+        # Start with yfinance data, add missing fields from Bloomberg
+        primary_df, fallback_df = yfinance_df, bloomberg_df
+    
+    # Nothing to fill in, or nothing to fill: skip the merge entirely
+    if fallback_df is None or fallback_df.empty:
+        logger.info("  Fallback source empty, using primary data as-is")
+        return primary_df, []
+    if primary_df is None or primary_df.empty:
+        logger.info("  Primary source empty, using fallback data as-is")
+        return fallback_df, fallback_df.index.tolist()
+    
+    # Fallback rows are added in one concat (in their original order and
+    # aligned to the primary's periods) instead of one .loc insert per field
+    is_missing = ~fallback_df.index.isin(primary_df.index)
+    fallback_fields = fallback_df.index[is_missing].tolist()
+    
+    logger.opt(lazy=True).debug("  Added from fallback source: {}", lambda: fallback_fields)
+    
+    if fallback_fields:
+        fallback_rows = fallback_df[is_missing].reindex(columns=primary_df.columns)
+        merged_df = pd.concat([primary_df, fallback_rows], axis=0)
+    else:
+        merged_df = primary_df.copy()
     
     logger.success(f"✅ Merged data:")
     logger.info(f"  Total fields: {len(merged_df)}")
@@ -459,7 +520,7 @@ def map_bloomberg_to_yfinance(
     logger.info("MAPPING BLOOMBERG DATA TO YFINANCE FORMAT")
     logger.info("=" * 70)
     
-    mapper = BloombergFieldMapper()
+    mapper = get_mapper()
     mapped_statements = {}
     
     # Map each statement
@@ -14,10 +14,13 @@ import pandas as pd
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from config.settings import init_config
 from agents import create_research_graph, create_initial_state
 from generators import generate_word_report, generate_excel_workbook
 from utils.logger import logger
 
+init_config()
+
 
 # Page configuration
 st.set_page_config(
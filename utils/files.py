@@ -0,0 +1,48 @@
+"""
+File helpers shared by the document generators.
+
+Provides atomic writes of in-memory documents to their final path.
+"""
+
+import io
+import os
+import stat
+import tempfile
+from contextlib import suppress
+from pathlib import Path
+
+# Process umask, read once (os.umask can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def write_atomically(buffer: io.BytesIO, filepath: Path) -> None:
+    """
+    Write serialised bytes to disk via a temp file and ``os.replace``.
+
+    Readers never see a partially written file. The result gets the mode an
+    ordinary ``open()`` would give it (the existing file's mode, or
+    0o666 minus the umask) rather than the temp file's owner-only 0o600.
+    The temp file is removed if anything fails before the replace.
+
+    Args:
+        buffer: In-memory file bytes
+        filepath: Destination path
+    """
+    filepath = Path(filepath)
+    try:
+        mode = stat.S_IMODE(os.stat(filepath).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+
+    tmp = tempfile.NamedTemporaryFile('wb', dir=filepath.parent, prefix=f".{filepath.stem}.",
+                                      suffix=f"{filepath.suffix}.tmp", delete=False)
+    try:
+        with tmp:
+            tmp.write(buffer.getbuffer())
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, filepath)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp.name)
+        raise